@@ -17,6 +17,7 @@ from rich.table import Table
 from src.config import AppConfig, EnvConfig, init_config
 from src.extractor import extract_game_locale
 from src.models import ErrorMarkers
+from src.string_store import open_table, store_path, table_exists
 from src.utils import (
     confirm,
     console,
@@ -60,12 +61,18 @@ def cli(ctx: click.Context, config: str, verbose: bool) -> None:
 @cli.command()
 @click.option("--language", "-l", help="Language to extract (zh_cn, en, etc.)")
 @click.option("--all", "-a", "all_langs", is_flag=True, help="Extract all languages")
+@click.option("--workers", "-w", type=int, help="Override decompression worker threads")
+@click.option("--force", "-f", is_flag=True, help="Re-extract all blocks, ignoring the extraction cache")
 @click.pass_context
-def extract(ctx: click.Context, language: str | None, all_langs: bool) -> None:
+def extract(
+    ctx: click.Context, language: str | None, all_langs: bool, workers: int | None, force: bool
+) -> None:
     """Extract texts from game binary files to CSV"""
     print_banner()
 
     config: AppConfig = ctx.obj["config"]
+    if workers:
+        config.extraction.workers = workers
     locale_dir = config.paths.game_locale_dir
 
     if not locale_dir.exists():
@@ -114,11 +121,19 @@ def extract(ctx: click.Context, language: str | None, all_langs: bool) -> None:
             locale_file,
             output_dir,
             log_callback=lambda msg: logger.debug(msg),
+            workers=config.extraction.workers,
+            force=force,
+            # autopatch rebuilds the archives from the source language's .dat files (and its diff's)
+            write_dat=config.extraction.keep_all_dat
+            or lang_code in (config.languages.source, f"{config.languages.source}_diff"),
+            csv_output=config.storage.write_csv,
         )
 
         if result.success:
+            logger.debug(result.message)
             csv_file = output_dir / "csv" / f"{lang_code}.csv"
-            csv_size = format_size(csv_file.stat().st_size) if csv_file.exists() else "?"
+            table_file = csv_file if config.storage.write_csv else store_path(csv_file)
+            csv_size = format_size(table_file.stat().st_size) if table_file.exists() else "?"
             print_success(
                 f"{lang_code}: {result.files_extracted} files, "
                 f"{result.texts_extracted:,} texts ({csv_size})"
@@ -132,28 +147,49 @@ def extract(ctx: click.Context, language: str | None, all_langs: bool) -> None:
 
 @cli.command()
 @click.option("--resume/--no-resume", default=True, help="Resume previous translation")
-@click.option("--batch-size", "-b", type=int, help="Override batch size")
+@click.option("--batch-size", "-b", type=int, help="Override batch size (max texts per batch)")
 @click.option("--verbose", "-V", is_flag=True, help="Show detailed batch info")
+@click.option("--no-memory", is_flag=True, help="Don't use the translation memory")
+@click.option("--bulk", is_flag=True, help="Write a batch-API request file instead of calling the LLM")
+@click.option(
+    "--bulk-format",
+    type=click.Choice(["openai", "anthropic"]),
+    help="Batch-API request format (default: by provider)",
+)
 @click.pass_context
-def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose: bool) -> None:
+def translate(
+    ctx: click.Context,
+    *,
+    resume: bool,
+    batch_size: int | None,
+    verbose: bool,
+    no_memory: bool,
+    bulk: bool,
+    bulk_format: str | None,
+) -> None:
     """Translate extracted texts using LLM"""
     print_banner()
 
     from src.batch_processor import BatchProcessor
-    from src.llm_client import LLMClient, PromptBuilder
+    from src.bulk_jobs import bulk_paths, default_format
+    from src.llm_client import PromptBuilder
+    from src.llm_pool import LLMPool, create_llm_client
 
     config: AppConfig = ctx.obj["config"]
     env_config: EnvConfig = ctx.obj["env"]
 
     if batch_size:
         config.batch.size = batch_size
+        config.batch.max_entries_per_batch = batch_size
+    if no_memory:
+        config.memory.enabled = False
 
     # Check files
     source_csv = config.get_source_csv()
     original_csv = config.get_original_csv()
     output_csv = config.get_output_csv()
 
-    if not source_csv.exists():
+    if not table_exists(source_csv):
         print_error(f"Source file not found: {source_csv}")
         console.print("Run 'extract' command first")
         return
@@ -166,19 +202,32 @@ def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose:
     table.add_row("Source", f"{config.languages.source} ({source_csv.name})")
     table.add_row(
         "Context",
-        f"{config.languages.original} ({original_csv.name if original_csv.exists() else 'N/A'})",
+        f"{config.languages.original} ({original_csv.name if table_exists(original_csv) else 'N/A'})",
     )
     table.add_row("Target", config.languages.target)
-    table.add_row("LLM", f"{config.llm.provider}/{config.llm.model}")
-    table.add_row("Batch size", str(config.batch.size))
+    if config.llm.backends:
+        table.add_row("LLM", f"pool of {len(config.llm.backends)} backends")
+    else:
+        table.add_row("LLM", f"{config.llm.provider}/{config.llm.model}")
+    if config.batch.token_packing:
+        table.add_row(
+            "Batch size",
+            f"up to {config.batch.max_entries_per_batch} texts / {config.batch.max_tokens_per_batch} tokens",
+        )
+    else:
+        table.add_row("Batch size", str(config.batch.size))
     table.add_row("Resume", str(resume))
+    table.add_row("Memory", str(config.get_memory_file()) if config.memory.enabled else "off")
+    fmt = bulk_format or default_format(config.llm.provider)
+    if bulk:
+        table.add_row("Mode", f"bulk ({fmt} batch API)")
 
     console.print(table)
     console.print()
 
-    # Check API key
+    # Check API key (pool backends check their own keys; bulk mode sends nothing)
     api_key = env_config.get_api_key(config.llm.provider)
-    if not api_key:
+    if not api_key and not config.llm.backends and not bulk:
         print_error(f"API key not set for {config.llm.provider}")
         console.print("Set it in .env file")
         return
@@ -187,7 +236,7 @@ def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose:
     console.print("[bold]Initializing...[/bold]")
 
     try:
-        llm_client = LLMClient(config.llm, env_config)
+        llm_client = None if bulk else create_llm_client(config.llm, env_config)
         prompt_builder = PromptBuilder(config.paths.rules_dir).load()
 
         def on_progress(progress):
@@ -215,6 +264,17 @@ def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose:
         print_success("Components ready")
         console.print()
 
+        if bulk:
+            requests_file, manifest_file, results_file = bulk_paths(config.paths.work_dir / "bulk", source_csv)
+            count = processor.export_bulk(
+                source_csv, original_csv, requests_file, manifest_file, fmt=fmt, resume=resume
+            )
+            console.print()
+            print_success(f"{count} requests written to {requests_file}")
+            console.print(f"Submit it to the {fmt} batch API, save the results as {results_file}")
+            console.print("and run 'ingest' (or try the flow locally with 'bulk-echo' and 'ingest --dry-run')")
+            return
+
         # Run
         console.print("[bold cyan]Starting translation...[/bold cyan]")
         console.print()
@@ -237,6 +297,9 @@ def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose:
         result_table.add_row("Skipped", str(progress.skipped_entries))
         result_table.add_row("Errors", str(progress.error_entries))
         result_table.add_row("Progress", f"{progress.progress_percent:.1f}%")
+        if isinstance(llm_client, LLMPool):
+            for name, summary in llm_client.stats():
+                result_table.add_row(name, summary)
 
         console.print(result_table)
         console.print()
@@ -247,6 +310,72 @@ def translate(ctx: click.Context, resume: bool, batch_size: int | None, verbose:
         logger.exception("Translation failed")
 
 
+@cli.command()
+@click.argument("results", required=False, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--manifest",
+    "-m",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Manifest written by 'translate --bulk' (default: next to the request file)",
+)
+@click.option("--dry-run", is_flag=True, help="Parse and count the results without saving anything")
+@click.pass_context
+def ingest(ctx: click.Context, results: Path | None, manifest: Path | None, dry_run: bool) -> None:
+    """Apply a batch-API results file from 'translate --bulk'"""
+    print_banner()
+
+    from src.batch_processor import BatchProcessor
+    from src.bulk_jobs import bulk_paths
+
+    config: AppConfig = ctx.obj["config"]
+    env_config: EnvConfig = ctx.obj["env"]
+
+    source_csv = config.get_source_csv()
+    _, default_manifest, default_results = bulk_paths(config.paths.work_dir / "bulk", source_csv)
+    results = results or default_results
+    manifest = manifest or default_manifest
+    for path in (results, manifest):
+        if not path.exists():
+            print_error(f"Not found: {path}")
+            return
+
+    processor = BatchProcessor(config=config, env_config=env_config)
+    try:
+        progress = processor.ingest_bulk(
+            source_csv, config.get_original_csv(), config.get_output_csv(), results, manifest, dry_run=dry_run
+        )
+    except Exception as e:
+        print_error(str(e))
+        logger.exception("Ingest failed")
+        return
+
+    if dry_run:
+        print_success(f"Dry run: {progress.translated_entries:,} would be translated, nothing saved")
+        return
+    print_success(f"{progress.translated_entries:,} translated ({progress.progress_percent:.1f}%)")
+
+
+@cli.command("bulk-echo")
+@click.argument("requests", required=False, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("results", required=False, type=click.Path(dir_okay=False, path_type=Path))
+@click.pass_context
+def bulk_echo(ctx: click.Context, requests: Path | None, results: Path | None) -> None:
+    """Answer a bulk request file locally with the English texts (stand-in for a batch API)"""
+    from src.bulk_jobs import bulk_paths, echo_results, echo_results_path
+
+    config: AppConfig = ctx.obj["config"]
+    default_requests, _, default_results = bulk_paths(config.paths.work_dir / "bulk", config.get_source_csv())
+    requests = requests or default_requests
+    results = results or echo_results_path(default_results)
+    if not requests.exists():
+        print_error(f"Not found: {requests} (run 'translate --bulk' first)")
+        return
+
+    count = echo_results(requests, results)
+    print_success(f"{count} results written to {results}")
+    console.print(f"Check them with 'ingest --dry-run {results}' (a real ingest refuses them)")
+
+
 @cli.command()
 @click.pass_context
 def status(ctx: click.Context) -> None:
@@ -265,10 +394,17 @@ def status(ctx: click.Context) -> None:
     csv_dir = config.paths.source_dir / "csv"
 
     if csv_dir.exists():
-        for csv_file in sorted(csv_dir.glob("*.csv")):
-            size = format_size(csv_file.stat().st_size)
-            lines = sum(1 for _ in open(csv_file, encoding="utf-8")) - 1
-            print_success(f"{csv_file.name}: {lines:,} entries ({size})")
+        names = {f.stem for f in csv_dir.glob("*.csv")} | {f.stem for f in csv_dir.glob("*.wst")}
+        for name in sorted(names):
+            csv_file = csv_dir / f"{name}.csv"
+            shown = csv_file if csv_file.exists() else store_path(csv_file)
+            size = format_size(shown.stat().st_size)
+            table = open_table(csv_file, persist=False)
+            if table is None:
+                continue
+            with table:
+                lines = len(table)
+            print_success(f"{shown.name}: {lines:,} entries ({size})")
     else:
         print_warning("Not extracted yet")
 
@@ -306,8 +442,10 @@ def status(ctx: click.Context) -> None:
 
 @cli.command()
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@click.option("--llm-cache", is_flag=True, help="Also clear cached LLM responses")
+@click.option("--memory", is_flag=True, help="Also delete the translation memory")
 @click.pass_context
-def reset(ctx: click.Context, force: bool) -> None:
+def reset(ctx: click.Context, force: bool, llm_cache: bool, memory: bool) -> None:
     """Reset translation progress"""
     config: AppConfig = ctx.obj["config"]
 
@@ -333,18 +471,36 @@ def reset(ctx: click.Context, force: bool) -> None:
     else:
         print_warning("No progress to reset")
 
+    if llm_cache:
+        from src.response_cache import ResponseCache
+
+        cache = ResponseCache(config.llm.cache_dir, config.llm.cache_max_mb * 1024 * 1024)
+        print_success(f"LLM cache cleared ({cache.clear()} responses deleted)")
+
+    if memory:
+        memory_file = config.get_memory_file()
+        if memory_file.exists():
+            memory_file.unlink()
+            print_success(f"Translation memory deleted ({memory_file.name})")
+        else:
+            print_warning("No translation memory to delete")
+
 
 @cli.command()
 @click.option("--install", "-i", is_flag=True, help="Install to game folder")
 @click.option("--with-diff", "-d", is_flag=True, help="Also patch diff files")
+@click.option(
+    "--reuse-blocks/--no-reuse-blocks",
+    default=True,
+    help="Copy unchanged compressed blocks from the game archive instead of recompressing",
+)
 @click.pass_context
-def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
+def autopatch(ctx: click.Context, install: bool, with_diff: bool, reuse_blocks: bool) -> None:
     """Auto-patch game files with translations (preserves original file structure)"""
-    import csv
     import shutil
 
     from src.extractor import BinaryExtractor
-    from src.hashmap_format import HashMapDatFile
+    from src.hashmap_format import HashMapDatFile, LayoutIndex
 
     print_banner()
     config: AppConfig = ctx.obj["config"]
@@ -369,36 +525,35 @@ def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
         console.print("Run 'extract' command first")
         return
 
-    if not translated_csv.exists():
+    if not table_exists(translated_csv):
         print_error(f"Translations not found: {translated_csv}")
         console.print("Run 'translate' command first")
         return
 
-    # Load English originals from source CSV (fallback for untranslated)
+    # Load English originals from source table (fallback for untranslated)
     console.print("[bold]Loading source texts...[/bold]")
     english_texts: dict[str, str] = {}
-    if source_csv.exists():
-        with open(source_csv, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            for row in reader:
-                if row.get("OriginalText"):
+    if (table := open_table(source_csv, persist=False)) is not None:
+        with table:
+            for text_id, text in table.iter_rows("ID", "OriginalText"):
+                if text:
                     # Unescape newlines
-                    text = row["OriginalText"].replace("\\n", "\n").replace("\\r", "\r")
-                    english_texts[row["ID"]] = text
+                    english_texts[text_id] = text.replace("\\n", "\n").replace("\\r", "\r")
         console.print(f"  Loaded {len(english_texts):,} English source texts")
 
     # Load translations (ID -> Russian text) - only translated ones
     console.print("[bold]Loading translations...[/bold]")
     translations: dict[str, str] = {}
     untranslated_count = 0
-    with open(translated_csv, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        for row in reader:
-            text_id = row["ID"]
-            if row.get("Status") == "translated" and row.get("Russian"):
+    table = open_table(translated_csv, persist=False)
+    if table is None:
+        print_error(f"Translations not found: {translated_csv}")
+        return
+    with table:
+        for text_id, status, russian in table.iter_rows("ID", "Status", "Russian"):
+            if status == "translated" and russian:
                 # Use Russian translation
-                text = row["Russian"].replace("\\n", "\n").replace("\\r", "\r")
-                translations[text_id] = text
+                translations[text_id] = russian.replace("\\n", "\n").replace("\\r", "\r")
             elif text_id in english_texts:
                 # Use English original for pending/error/skipped/empty
                 translations[text_id] = english_texts[text_id]
@@ -421,12 +576,14 @@ def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
 
         files_count = 0
         texts_patched = 0
+        unrecognized: list[str] = []
+        layout_index = LayoutIndex.for_dir(source_dir)
 
         for dat_file in sorted(source_dir.glob("*.dat")):
             data = dat_file.read_bytes()
             parser = HashMapDatFile()
 
-            if parser.read(data) and parser.entries:
+            if parser.read(data, layout_index, dat_file.name) and parser.entries:
                 # Apply translations
                 file_patched = 0
                 for entry in parser.entries:
@@ -441,24 +598,35 @@ def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
                     new_data = data
             else:
                 # Can't parse or empty - copy as-is
+                if parser.layout_error:
+                    unrecognized.append(f"{dat_file.name}: {parser.layout_error}")
                 new_data = data
 
             (packed_dir / dat_file.name).write_bytes(new_data)
             files_count += 1
 
+        layout_index.save()
         console.print(f"  Patched: {files_count} files ({texts_patched:,} texts replaced)")
 
-        # Create archive
+        if unrecognized:
+            print_warning(f"{len(unrecognized)} files not patched (copied unchanged):")
+            for line in unrecognized[:5]:
+                console.print(f"    {line}")
+            if len(unrecognized) > 5:
+                console.print(f"    ... +{len(unrecognized) - 5} more")
+
+        # Create archive (unchanged blocks are copied from the archive the .dat files came from)
         output_file = config.paths.translated_dir / f"translate_words_map_{output_name}"
-        binary_extractor = BinaryExtractor()
-        archive_result = binary_extractor.pack(packed_dir, output_file)
+        base_archive = game_locale_dir / f"translate_words_map_{source_dir.name}" if reuse_blocks else None
+        binary_extractor = BinaryExtractor(workers=config.extraction.workers)
+        archive_result = binary_extractor.pack(packed_dir, output_file, base_archive=base_archive)
 
         if not archive_result.success:
             print_error(f"Archive failed: {archive_result.message}")
             return None
 
         size = format_size(output_file.stat().st_size)
-        console.print(f"  Archive: {output_file.name} ({size})")
+        console.print(f"  Archive: {output_file.name} ({size}) - {archive_result.message}")
         console.print()
 
         return output_file
@@ -473,15 +641,13 @@ def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
         if diff_dat_dir.exists():
             # Load English texts from diff CSV for fallback
             diff_source_csv = config.paths.source_dir / "csv" / f"{source_lang}_diff.csv"
-            if diff_source_csv.exists():
+            if (table := open_table(diff_source_csv, persist=False)) is not None:
                 console.print("[bold]Loading diff source texts...[/bold]")
-                with open(diff_source_csv, encoding="utf-8", newline="") as f:
-                    reader = csv.DictReader(f, delimiter=";")
+                with table:
                     diff_english_count = 0
-                    for row in reader:
-                        if row.get("OriginalText"):
-                            text = row["OriginalText"].replace("\\n", "\n").replace("\\r", "\r")
-                            text_id = row["ID"]
+                    for text_id, raw_text in table.iter_rows("ID", "OriginalText"):
+                        if raw_text:
+                            text = raw_text.replace("\\n", "\n").replace("\\r", "\r")
                             # Add to english_texts if not already present
                             if text_id not in english_texts:
                                 english_texts[text_id] = text
@@ -529,8 +695,6 @@ def autopatch(ctx: click.Context, install: bool, with_diff: bool) -> None:
 @click.pass_context
 def extract_diff(ctx: click.Context) -> None:
     """Extract diff files (updates/patches) for translation"""
-    from src.extractor import BinaryExtractor, TextExtractor
-
     print_banner()
     config: AppConfig = ctx.obj["config"]
 
@@ -563,11 +727,13 @@ def extract_diff(ctx: click.Context) -> None:
 
     console.print(f"[bold]Extracting: {diff_file.name}...[/bold]")
     
-    output_dir = config.paths.source_dir / "dat" / f"{source_lang}_diff"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    extractor = BinaryExtractor(log_callback=lambda msg: logger.debug(msg))
-    result = extractor.extract(diff_file, output_dir)
+    result = extract_game_locale(
+        diff_file,
+        config.paths.source_dir,
+        log_callback=lambda msg: logger.debug(msg),
+        workers=config.extraction.workers,
+        csv_output=config.storage.write_csv,
+    )
 
     if not result.success:
         print_error(f"Extraction failed: {result.message}")
@@ -575,13 +741,10 @@ def extract_diff(ctx: click.Context) -> None:
 
     print_success(f"Extracted {result.files_extracted} .dat files")
 
-    # Extract texts
-    text_extractor = TextExtractor()
     csv_file = config.paths.source_dir / "csv" / f"{source_lang}_diff.csv"
-    text_result = text_extractor.extract(output_dir, csv_file)
     
-    if text_result.success:
-        print_success(f"Extracted {text_result.texts_extracted:,} texts to {csv_file.name}")
+    if result.texts_extracted:
+        print_success(f"Extracted {result.texts_extracted:,} texts to {csv_file.name}")
         console.print()
         console.print("[bold]Next steps:[/bold]")
         console.print("  1. Translate diff texts (they will be included automatically)")
@@ -600,6 +763,7 @@ def validate(ctx: click.Context, fix: bool, check_broken: bool) -> None:
     import re
 
     from src.issue_fixer import BrokenStringDetector
+    from src.string_store import TableWriter
 
     print_banner()
     config: AppConfig = ctx.obj["config"]
@@ -607,11 +771,11 @@ def validate(ctx: click.Context, fix: bool, check_broken: bool) -> None:
     source_csv = config.get_source_csv()
     translated_csv = config.get_output_csv()
 
-    if not source_csv.exists():
+    if not table_exists(source_csv):
         print_error(f"Source CSV not found: {source_csv}")
         return
 
-    if not translated_csv.exists():
+    if not table_exists(translated_csv):
         print_error(f"Translations not found: {translated_csv}")
         return
 
@@ -633,11 +797,12 @@ def validate(ctx: click.Context, fix: bool, check_broken: bool) -> None:
         return special_pattern.findall(text)
 
     # Load source texts
-    source_texts: dict[str, str] = {}
-    with open(source_csv, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        for row in reader:
-            source_texts[row["ID"]] = row["OriginalText"]
+    table = open_table(source_csv, persist=False)
+    if table is None:
+        print_error(f"Source not found: {source_csv}")
+        return
+    with table:
+        source_texts = table.to_dict("OriginalText")
 
     # Initialize broken string detector
     broken_detector = BrokenStringDetector() if check_broken else None
@@ -652,16 +817,17 @@ def validate(ctx: click.Context, fix: bool, check_broken: bool) -> None:
     # Track issue types
     issue_type_counts: dict[str, int] = {}
 
-    with open(translated_csv, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        for row in reader:
-            if row.get("Status") != "translated" or not row.get("Russian"):
+    table = open_table(translated_csv, persist=False)
+    if table is None:
+        print_error(f"Translations not found: {translated_csv}")
+        return
+    with table:
+        for text_id, english, translated, status in table.iter_rows("ID", "English", "Russian", "Status"):
+            if status != "translated" or not translated:
                 continue
 
             total_count += 1
-            text_id = row["ID"]
-            original = source_texts.get(text_id, row.get("English", ""))
-            translated = row["Russian"]
+            original = source_texts.get(text_id, english)
             has_issue = False
 
             # Check for error markers (incomplete LLM responses)
@@ -805,45 +971,50 @@ def validate(ctx: click.Context, fix: bool, check_broken: bool) -> None:
             console.print()
             console.print("[bold]Marking invalid translations for re-translation...[/bold]")
 
-            # Update CSV
-            rows = []
-            with open(translated_csv, encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f, delimiter=";")
-                fieldnames = reader.fieldnames
-                rows = list(reader)
-
+            # Update translations table
+            table = open_table(translated_csv)
+            if table is None:
+                print_error(f"Translations not found: {translated_csv}")
+                return
+            with table:
+                fieldnames = table.columns
+                rows = [list(row) for row in table.iter_rows(*fieldnames)]
+
+            id_idx = fieldnames.index("ID")
+            status_idx = fieldnames.index("Status")
+            en_idx = fieldnames.index("English")
+            orig_idx = fieldnames.index("Original")
             fixed = 0
+            rejected: list[tuple[str, str]] = []
             for row in rows:
-                if row["ID"] in rows_to_fix:
-                    row["Status"] = "needs_retranslation"
+                if row[id_idx] in rows_to_fix:
+                    row[status_idx] = "needs_retranslation"
+                    rejected.append((row[en_idx], row[orig_idx]))
                     fixed += 1
 
-            with open(translated_csv, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-                writer.writeheader()
-                writer.writerows(rows)
+            with TableWriter(translated_csv, fieldnames, csv_file=config.storage.write_csv) as table_writer:
+                table_writer.writerows(rows)
 
-            # Also remove from progress tracker (JSON files)
-            import json
-            progress_dir = config.paths.progress_dir
-            translations_file = progress_dir / f"{source_csv.stem}_translations.json"
-            
-            if translations_file.exists():
-                try:
-                    tracker_data = json.loads(translations_file.read_text(encoding="utf-8"))
-                    removed = 0
-                    for entry_id in rows_to_fix:
-                        if entry_id in tracker_data:
-                            del tracker_data[entry_id]
-                            removed += 1
-                    
-                    translations_file.write_text(
-                        json.dumps(tracker_data, ensure_ascii=False, indent=2),
-                        encoding="utf-8"
-                    )
-                    console.print(f"  Removed {removed:,} from progress tracker")
-                except Exception as e:
-                    print_warning(f"Could not update progress tracker: {e}")
+            # Also remove from progress tracker
+            from src.batch_processor import ProgressTracker
+
+            try:
+                tracker = ProgressTracker(config.paths.progress_dir, source_file=source_csv)
+                tracker.load_translations()
+                removed = tracker.remove_many(rows_to_fix)
+                tracker.save()
+                console.print(f"  Removed {removed:,} from progress tracker")
+            except Exception as e:
+                print_warning(f"Could not update progress tracker: {e}")
+
+            # And from the translation memory, or 'translate' would reuse them as exact matches
+            memory_file = config.get_memory_file()
+            if memory_file.exists():
+                from src.translation_memory import TranslationMemory
+
+                with TranslationMemory(memory_file, config.languages.target) as memory:
+                    forgotten = memory.remove_many(rejected)
+                console.print(f"  Removed {forgotten:,} from translation memory")
 
             print_success(f"Marked {fixed:,} translations for re-translation")
             console.print("Run 'translate' again to re-translate them")
@@ -861,7 +1032,7 @@ def fix_issues(ctx: click.Context, batch_size: int, limit: int | None, dry_run:
     print_banner()
 
     from src.issue_fixer import IssueFixer
-    from src.llm_client import LLMClient
+    from src.llm_pool import create_llm_client
 
     config: AppConfig = ctx.obj["config"]
     env_config: EnvConfig = ctx.obj["env"]
@@ -874,7 +1045,7 @@ def fix_issues(ctx: click.Context, batch_size: int, limit: int | None, dry_run:
         console.print("Run 'validate' command first")
         return
 
-    if not translated_csv.exists():
+    if not table_exists(translated_csv):
         print_error(f"Translations not found: {translated_csv}")
         return
 
@@ -882,7 +1053,8 @@ def fix_issues(ctx: click.Context, batch_size: int, limit: int | None, dry_run:
     console.print("[bold]Loading validation issues...[/bold]")
     
     try:
-        llm_client = LLMClient(config.llm, env_config)
+        # A fix request must reach the model: replaying a cached answer would repeat the same fixes
+        llm_client = create_llm_client(config.llm.model_copy(update={"cache": False}), env_config)
         fixer = IssueFixer(
             llm_client=llm_client,
             batch_size=batch_size,
@@ -941,7 +1113,15 @@ def fix_issues(ctx: click.Context, batch_size: int, limit: int | None, dry_run:
         # Apply fixes
         console.print()
         console.print("[bold]Applying fixes...[/bold]")
-        updated = fixer.apply_fixes(fixes, translated_csv)
+        if config.memory.enabled:
+            from src.translation_memory import TranslationMemory
+
+            with TranslationMemory(config.get_memory_file(), config.languages.target) as memory:
+                updated = fixer.apply_fixes(
+                    fixes, translated_csv, csv_file=config.storage.write_csv, memory=memory
+                )
+        else:
+            updated = fixer.apply_fixes(fixes, translated_csv, csv_file=config.storage.write_csv)
         
         print_success(f"Updated {updated:,} translations in {translated_csv.name}")
         console.print()
@@ -969,7 +1149,8 @@ def test_llm(ctx: click.Context) -> None:
     console.print()
 
     try:
-        client = LLMClient(config.llm, env_config)
+        # Always reach the provider: a cached answer would not test the connection
+        client = LLMClient(config.llm.model_copy(update={"cache": False}), env_config)
 
         test_texts = [
             {
@@ -996,12 +1177,63 @@ def test_llm(ctx: click.Context) -> None:
         print_error(error_msg)
 
 
+def _table_files(config: AppConfig, suffix: str) -> list[Path]:
+    """Extracted tables plus the translation output, as files with ``suffix``."""
+    files = sorted((config.paths.source_dir / "csv").glob(f"*{suffix}"))
+    output = config.get_output_csv().with_suffix(suffix)
+    if output.exists():
+        files.append(output)
+    return files
+
+
+@cli.command("import-csv")
+@click.argument("files", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.pass_context
+def import_csv(ctx: click.Context, files: tuple[Path, ...]) -> None:
+    """Build string stores (.wst) from CSV tables (default: all known tables)"""
+    from src.string_store import import_csv as import_table
+
+    print_banner()
+    config: AppConfig = ctx.obj["config"]
+
+    targets = list(files) or _table_files(config, ".csv")
+    if not targets:
+        print_warning("No CSV files found")
+        return
+
+    for csv_file in targets:
+        rows = import_table(csv_file)
+        print_success(f"{csv_file.name} -> {store_path(csv_file).name}: {rows:,} rows")
+
+
+@cli.command("export-csv")
+@click.argument("files", nargs=-1, type=click.Path(dir_okay=False, path_type=Path))
+@click.pass_context
+def export_csv(ctx: click.Context, files: tuple[Path, ...]) -> None:
+    """Write CSV tables from string stores (default: all known stores)"""
+    from src.string_store import export_csv as export_table
+
+    print_banner()
+    config: AppConfig = ctx.obj["config"]
+
+    targets = [f.with_suffix(".csv") for f in files or _table_files(config, ".wst")]
+    if not targets:
+        print_warning("No string stores found")
+        return
+
+    for csv_file in targets:
+        if not store_path(csv_file).exists():
+            print_error(f"Store not found: {store_path(csv_file)}")
+            continue
+        rows = export_table(csv_file)
+        print_success(f"{store_path(csv_file).name} -> {csv_file.name}: {rows:,} rows")
+
+
 @cli.command("export-web")
 @click.option("--limit", "-l", type=int, help="Limit number of entries to export")
 @click.pass_context
 def export_web(ctx: click.Context, limit: int | None) -> None:
     """Export translations to JSON for GitHub Pages"""
-    import csv
     import json
 
     print_banner()
@@ -1012,7 +1244,7 @@ def export_web(ctx: click.Context, limit: int | None) -> None:
     translated_csv = config.get_output_csv()
     docs_dir = Path("docs/data")
 
-    if not translated_csv.exists():
+    if not table_exists(translated_csv):
         print_error(f"Translations not found: {translated_csv}")
         return
 
@@ -1023,19 +1255,15 @@ def export_web(ctx: click.Context, limit: int | None) -> None:
 
     # Load source texts (English)
     source_texts: dict[str, str] = {}
-    if source_csv.exists():
-        with open(source_csv, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            for row in reader:
-                source_texts[row["ID"]] = row["OriginalText"]
+    if (table := open_table(source_csv, persist=False)) is not None:
+        with table:
+            source_texts = table.to_dict("OriginalText")
 
     # Load original texts (Chinese)
     original_texts: dict[str, str] = {}
-    if original_csv.exists():
-        with open(original_csv, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            for row in reader:
-                original_texts[row["ID"]] = row["OriginalText"]
+    if (table := open_table(original_csv, persist=False)) is not None:
+        with table:
+            original_texts = table.to_dict("OriginalText")
 
     # Load and export translations
     translations = []
@@ -1047,12 +1275,14 @@ def export_web(ctx: click.Context, limit: int | None) -> None:
         "issues": 0,
     }
 
-    with open(translated_csv, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter=";")
-        for row in reader:
+    table = open_table(translated_csv, persist=False)
+    if table is None:
+        print_error(f"Translations not found: {translated_csv}")
+        return
+    with table:
+        for text_id, english, russian, status in table.iter_rows("ID", "English", "Russian", "Status"):
             stats["total"] += 1
             
-            status = row.get("Status", "")
             if status == "translated":
                 stats["translated"] += 1
             elif status == "skipped":
@@ -1065,12 +1295,12 @@ def export_web(ctx: click.Context, limit: int | None) -> None:
             # Export all entries (translated, issues, pending)
             if status != "skipped":
                 entry = {
-                    "id": row["ID"],
-                    "en": source_texts.get(row["ID"], row.get("English", "")),
-                    "ru": row.get("Russian", ""),
+                    "id": text_id,
+                    "en": source_texts.get(text_id, english),
+                    "ru": russian,
                     "status": status if status else "pending",
                 }
-                if zh := original_texts.get(row["ID"]):
+                if zh := original_texts.get(text_id):
                     entry["zh"] = zh
                 
                 translations.append(entry)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .models import TranslationEntry
+    from .tokenizer import TokenCounter
+
+
+class BatchPlanner:
+    """Packs entries into request batches by estimated token cost.
+
+    Entries stay in table order and batches are contiguous, so neighbouring lines share a
+    request (and its context window). A batch is closed when the next entry would push the
+    estimated prompt + response over ``max_tokens``, the response over ``max_output_tokens``
+    or the batch over ``max_entries``. Once a batch is reasonably full it is also closed at
+    a gap in the table, rather than splitting the next run of adjacent entries.
+    """
+
+    OUTPUT_RATIO = 2.0  # Russian output takes about twice the tokens of the English source
+    ITEM_INPUT_OVERHEAD = 8  # "[n]", "EN: ", "ZH: " and line breaks
+    ITEM_OUTPUT_OVERHEAD = 4  # Quotes, comma and escapes in the JSON array
+    BATCH_OVERHEAD = 60  # Section headers and response format instructions
+    OUTPUT_HEADROOM = 0.8  # Share of the model's max_tokens the estimate may use
+    GAP_BREAK_FILL = 0.5  # Fill ratio after which a batch ends at a table gap
+
+    __slots__ = ("_counter", "context_items", "max_entries", "max_output_tokens", "max_tokens")
+
+    def __init__(
+        self,
+        counter: TokenCounter,
+        max_tokens: int,
+        max_output_tokens: int,
+        max_entries: int,
+        context_items: int = 0,
+    ):
+        self._counter = counter
+        self.max_tokens = max_tokens
+        self.max_output_tokens = max(1, int(max_output_tokens * self.OUTPUT_HEADROOM))
+        self.max_entries = max_entries
+        self.context_items = context_items
+
+    def estimate(self, entry: TranslationEntry) -> tuple[int, int]:
+        """Estimated (input, output) tokens for one entry."""
+        english = self._counter.count_tokens(entry.english)
+        input_tokens = english + self._counter.count_tokens(entry.original) + self.ITEM_INPUT_OVERHEAD
+        output_tokens = int(english * self.OUTPUT_RATIO) + self.ITEM_OUTPUT_OVERHEAD
+        return input_tokens, output_tokens
+
+    def plan(
+        self,
+        entries: Sequence[TranslationEntry],
+        position: Callable[[str], int | None] | None = None,
+    ) -> list[list[TranslationEntry]]:
+        """Split ``entries`` (in table order) into batches.
+
+        ``position`` maps an entry id to its table row; without it gaps are not detected.
+        """
+        if not entries:
+            return []
+
+        costs = [self.estimate(entry) for entry in entries]
+        # Context lines are shown with every batch; reserve room for an average one each
+        average_input = sum(cost[0] for cost in costs) // len(costs)
+        reserve = self.BATCH_OVERHEAD + self.context_items * average_input
+
+        batches: list[list[TranslationEntry]] = []
+        batch: list[TranslationEntry] = []
+        batch_tokens = reserve
+        batch_output = 0
+        last_pos: int | None = None
+
+        for entry, (input_tokens, output_tokens) in zip(entries, costs):
+            pos = position(entry.id) if position else None
+            if batch:
+                tokens = batch_tokens + input_tokens + output_tokens
+                full = (
+                    len(batch) >= self.max_entries
+                    or tokens > self.max_tokens
+                    or batch_output + output_tokens > self.max_output_tokens
+                )
+                at_gap = pos is not None and last_pos is not None and pos != last_pos + 1
+                if full or (at_gap and self._fill(batch, batch_tokens, batch_output) >= self.GAP_BREAK_FILL):
+                    batches.append(batch)
+                    batch, batch_tokens, batch_output = [], reserve, 0
+
+            # An entry over budget on its own still gets a batch of its own
+            batch.append(entry)
+            batch_tokens += input_tokens + output_tokens
+            batch_output += output_tokens
+            last_pos = pos
+
+        batches.append(batch)
+        return batches
+
+    def _fill(self, batch: list[TranslationEntry], tokens: int, output: int) -> float:
+        return max(
+            len(batch) / self.max_entries,
+            tokens / self.max_tokens,
+            output / self.max_output_tokens,
+        )
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
 import asyncio
-import csv
-import hashlib
+import contextlib
 import json
 import logging
+import os
 import signal
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from .batch_planner import BatchPlanner
+from .concurrency import AdaptiveConcurrency
 from .config import AppConfig, EnvConfig, get_config, get_env_config
+from .entry_store import EntryStore, group_duplicates
 from .models import ErrorMarkers, TranslationEntry, TranslationProgress, TranslationStatus
+from .string_store import TableWriter, open_table, source_digest
 from .tokenizer import CostConfig, TokenCounter
+from .translation_memory import MemoryMatch, TranslationMemory
 
 
 if TYPE_CHECKING:
     from .llm_client import LLMClient, PromptBuilder
+    from .llm_pool import LLMPool
 
 logger = logging.getLogger(__name__)
 
@@ -97,13 +103,22 @@ class ETACalculator:
 
 @dataclass
 class ProgressTracker:
-    """Thread-safe progress persistence with atomic saves."""
+    """Progress persistence: a small progress file plus an append-only translation journal.
+
+    Translations are kept as a snapshot (``*_translations.json``) and a JSONL journal of
+    the changes made since (``*_journal.jsonl``, one ``{id: translation | null}`` object
+    per checkpoint). ``save`` appends only what changed since the last save, so a
+    checkpoint costs O(batch); ``compact`` folds the journal back into the snapshot.
+    """
+
+    COMPACT_EVERY: ClassVar[int] = 200  # Journal records before the snapshot is rewritten
 
     progress_dir: Path
     source_file: Path
     _progress: TranslationProgress | None = field(default=None, repr=False)
     _translations: dict[str, str] = field(default_factory=dict, repr=False)
-    _dirty: bool = field(default=False, repr=False)
+    _changed: dict[str, str | None] = field(default_factory=dict, repr=False)  # None = removed
+    _journal_records: int = field(default=0, repr=False)
 
     def __post_init__(self) -> None:
         self.progress_dir = Path(self.progress_dir)
@@ -118,8 +133,12 @@ class ProgressTracker:
     def translations_file(self) -> Path:
         return self.progress_dir / f"{self.source_file.stem}_translations.json"
 
-    def load(self) -> TranslationProgress | None:
-        """Load progress from disk (sync)."""
+    @property
+    def journal_file(self) -> Path:
+        return self.progress_dir / f"{self.source_file.stem}_journal.jsonl"
+
+    def load(self, read_only: bool = False) -> TranslationProgress | None:
+        """Load progress from disk (sync). ``read_only`` never writes, not even repairs."""
         if not self.progress_file.exists():
             logger.info("No previous progress found")
             return None
@@ -133,8 +152,7 @@ class ProgressTracker:
                 logger.warning("Source file changed, resetting progress")
                 return None
 
-            if self.translations_file.exists():
-                self._translations = json.loads(self.translations_file.read_text(encoding="utf-8"))
+            self.load_translations(read_only)
 
             logger.info(
                 f"Resumed: {self._progress.progress_percent:.1f}% "
@@ -146,35 +164,89 @@ class ProgressTracker:
             logger.error(f"Failed to load progress: {e}")
             return None
 
+    def load_translations(self, read_only: bool = False) -> None:
+        """Read the snapshot and replay the journal on top of it."""
+        translations: dict[str, str] = {}
+        if self.translations_file.exists():
+            translations = json.loads(self.translations_file.read_text(encoding="utf-8"))
+
+        records = 0
+        truncated = False
+        if self.journal_file.exists():
+            with open(self.journal_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Only the last record can be cut short (crash mid-append)
+                        logger.warning(f"Ignoring truncated record in {self.journal_file.name}")
+                        truncated = True
+                        break
+                    for entry_id, translation in record.items():
+                        if translation is None:
+                            translations.pop(entry_id, None)
+                        else:
+                            translations[entry_id] = translation
+                    records += 1
+
+        self._translations = translations
+        self._changed = {}
+        self._journal_records = records
+        if truncated and not read_only:
+            # Appending after the broken line would hide new records from the next replay
+            self.compact()
+
     def save(self) -> None:
-        """Save progress atomically (sync)."""
-        if self._progress is None:
+        """Checkpoint: append changes to the journal and rewrite the progress file (sync)."""
+        if self._progress is None and not self._changed:
             return
 
-        self._progress.update_timestamp()
+        try:
+            if self._changed:
+                self._append_journal()
+
+            if self._progress is not None:
+                self._progress.update_timestamp()
+                temp_progress = self.progress_file.with_suffix(".tmp")
+                temp_progress.write_text(
+                    json.dumps(self._progress.to_dict(), ensure_ascii=False, indent=2),
+                    encoding="utf-8",
+                )
+                temp_progress.replace(self.progress_file)
 
-        # Atomic write using temp file
-        temp_progress = self.progress_file.with_suffix(".tmp")
-        temp_translations = self.translations_file.with_suffix(".tmp")
+            if self._journal_records >= self.COMPACT_EVERY:
+                self.compact()
 
-        try:
-            temp_progress.write_text(
-                json.dumps(self._progress.to_dict(), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            temp_progress.replace(self.progress_file)
+        except Exception as e:
+            logger.error(f"Save failed: {e}")
 
+    def _append_journal(self) -> None:
+        line = json.dumps(self._changed, ensure_ascii=False, separators=(",", ":"))
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._changed = {}
+        self._journal_records += 1
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with all translations and empty the journal (O(total))."""
+        temp_translations = self.translations_file.with_suffix(".tmp")
+        try:
+            # Journal pending changes first: should we crash between the snapshot replace
+            # and the unlink, replaying the journal then ends in the snapshot's state
+            if self._changed:
+                self._append_journal()
             temp_translations.write_text(
-                json.dumps(self._translations, ensure_ascii=False, indent=2),
+                json.dumps(self._translations, ensure_ascii=False, separators=(",", ":")),
                 encoding="utf-8",
             )
             temp_translations.replace(self.translations_file)
-
-            self._dirty = False
-
+            self.journal_file.unlink(missing_ok=True)
+            self._changed = {}
+            self._journal_records = 0
         except Exception as e:
-            logger.error(f"Save failed: {e}")
-            temp_progress.unlink(missing_ok=True)
+            logger.error(f"Compaction failed: {e}")
             temp_translations.unlink(missing_ok=True)
 
     def init_new(self, total: int) -> TranslationProgress:
@@ -184,38 +256,50 @@ class ProgressTracker:
             source_file_hash=self._file_hash(self.source_file),
         )
         self._translations = {}
-        self._dirty = True
+        self._changed = {}
+        # The old journal must not be replayed onto the empty snapshot
+        self.journal_file.unlink(missing_ok=True)
+        self.compact()
         self.save()
         return self._progress
 
     def update(self, entry_id: str, translation: str) -> None:
         """Update single translation."""
         self._translations[entry_id] = translation
-        self._dirty = True
+        self._changed[entry_id] = translation
 
     def update_batch(self, translations: dict[str, str]) -> None:
         """Update multiple translations."""
         self._translations.update(translations)
-        self._dirty = True
+        self._changed.update(translations)
 
     def get(self, entry_id: str) -> str | None:
         """Get saved translation."""
         return self._translations.get(entry_id)
 
+    def items(self) -> Iterator[tuple[str, str]]:
+        """All saved (entry_id, translation) pairs."""
+        return iter(self._translations.items())
+
     def remove(self, entry_id: str) -> None:
         """Remove translation (for retry)."""
         if entry_id in self._translations:
             del self._translations[entry_id]
-            self._dirty = True
+            self._changed[entry_id] = None
+
+    def remove_many(self, entry_ids: Iterable[str]) -> int:
+        """Remove translations (for retry). Returns how many were saved."""
+        removed = 0
+        for entry_id in entry_ids:
+            if entry_id in self._translations:
+                self.remove(entry_id)
+                removed += 1
+        return removed
 
     @staticmethod
     def _file_hash(path: Path) -> str:
-        """Calculate MD5 hash."""
-        hasher = hashlib.md5()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        """MD5 of the source table's CSV form (the same for either storage backend)."""
+        return source_digest(path)
 
 
 @dataclass(slots=True)
@@ -227,7 +311,10 @@ class BatchResult:
     success: bool
     error: str = ""
     duration: float = 0.0
+    latency: float = 0.0  # Model call only (no limiter wait or retry backoff), for AdaptiveConcurrency
     length_warnings: int = 0
+    systemic: bool = False  # Failure unrelated to the texts (quota, rate limit, outage, shutdown)
+    failures: dict[str, str] = field(default_factory=dict)  # Entry id -> error, for isolated failures
 
 
 def check_translation_length(
@@ -245,6 +332,13 @@ def check_translation_length(
     return ratio <= max_ratio, ratio
 
 
+def _is_systemic(error: Exception) -> bool:
+    """True for failures that splitting the batch can't fix."""
+    from .llm_client import SYSTEMIC_ERRORS
+
+    return isinstance(error, SYSTEMIC_ERRORS)
+
+
 class BatchProcessor:
     """
     Async batch processor with:
@@ -253,15 +347,16 @@ class BatchProcessor:
     - Token counting and cost estimation
     - Graceful Ctrl+C shutdown
     - Verbose mode with detailed output
-    - Progress saved after every batch
+    - Progress saved every N batches (progress.save_every_n_batches)
     """
 
     def __init__(
         self,
         config: AppConfig | None = None,
         env_config: EnvConfig | None = None,
-        llm_client: LLMClient | None = None,
+        llm_client: LLMClient | LLMPool | None = None,
         prompt_builder: PromptBuilder | None = None,
+        *,
         progress_callback: ProgressCallback | None = None,
         log_callback: LogCallback | None = None,
         verbose: bool = False,
@@ -274,7 +369,6 @@ class BatchProcessor:
         self._log = log_callback or (lambda msg: print(msg))  # Direct print for visibility
         self._verbose = verbose
         self._shutdown_requested = False
-        self._semaphore: asyncio.Semaphore | None = None
         self._eta = ETACalculator()
         self._token_counter = TokenCounter(self._config.llm.model)
         self._cost_config = CostConfig(
@@ -282,6 +376,13 @@ class BatchProcessor:
             price_output=self._env_config.token_price_output,
         )
         self._system_prompt: str = ""  # Cache for token counting
+        self._duplicates: dict[str, list[TranslationEntry]] = {}  # Representative id -> copies
+        self._memory: TranslationMemory | None = None
+        self._concurrency: AdaptiveConcurrency | None = None
+        self._quarantine: dict[str, tuple[TranslationEntry, str]] = {}  # Entry id -> (entry, error)
+        self._tracker: ProgressTracker | None = None
+        self._retry_ids: set[str] = set()  # Rejected translations: not to be refilled from memory
+        self._rate_limit_hits = 0  # LLMClient.rate_limit_hits already acted on
 
     def _setup_signal_handler(self) -> None:
         """Setup Ctrl+C handler for Windows."""
@@ -310,82 +411,108 @@ class BatchProcessor:
 
             self._llm = LLMClient()
 
-        if self._prompt_builder is None:
-            from .llm_client import PromptBuilder
+        session = self._load_session(source_csv, original_csv, resume)
+        if session is None:
+            return TranslationProgress()
 
-            self._prompt_builder = PromptBuilder(self._config.paths.rules_dir).load()
+        with self._open_memory():
+            return await self._process_entries(*session, output_csv)
 
-        self._semaphore = asyncio.Semaphore(self._config.batch.concurrent_requests)
+    def _load_session(
+        self, source_csv: Path, original_csv: Path, resume: bool, *, read_only: bool = False
+    ) -> tuple[EntryStore, TranslationProgress, ProgressTracker] | None:
+        """Load the entries and restore (or start) progress. None if there is nothing to load.
 
+        ``read_only`` leaves the progress files as they are: a fresh start is kept in memory.
+        """
         self._log(f"Loading: {source_csv.name} + {original_csv.name}")
-        entries = self._load_entries(source_csv, original_csv)
+        entries = EntryStore(self._load_entries(source_csv, original_csv))
 
         if not entries:
             self._log("No entries to translate")
-            return TranslationProgress()
+            return None
 
         self._log(f"Loaded {len(entries)} entries")
 
         tracker = ProgressTracker(self._config.paths.progress_dir, source_file=source_csv)
+        self._retry_ids.clear()
 
         progress: TranslationProgress | None = None
         if resume:
-            progress = tracker.load()
+            progress = tracker.load(read_only)
             if progress:
                 restored = 0
-                for entry in entries:
-                    if saved := tracker.get(entry.id):
-                        entry.translated = saved
-                        entry.status = TranslationStatus.TRANSLATED
+                for entry_id, saved in tracker.items():
+                    if saved and (entry := entries.get(entry_id)) is not None:
+                        entries.mark_translated(entry, saved)
                         restored += 1
                 self._log(f"Restored {restored} translations from previous session")
 
                 # Check for entries with error markers - they need retry
                 retry_count = 0
-                for entry in entries:
+                for entry in entries.with_status(TranslationStatus.TRANSLATED):
                     if entry.needs_retry():
-                        entry.mark_for_retry()
-                        tracker.remove(entry.id)  # Remove from tracker so it gets re-translated
+                        entries.mark_for_retry(entry)
+                        if not read_only:
+                            tracker.remove(entry.id)  # Remove from tracker so it gets re-translated
+                        self._retry_ids.add(entry.id)
                         retry_count += 1
                         progress.translated_entries -= 1
 
                 if retry_count > 0:
                     self._log(f"Found {retry_count} entries with error markers - will retry")
 
-        if progress is None:
+        if progress is None and read_only:
+            progress = TranslationProgress(total_entries=len(entries), source_file_hash=source_digest(source_csv))
+        elif progress is None:
             progress = tracker.init_new(len(entries))
 
-        to_translate = [
-            e
-            for e in entries
-            if e.status == TranslationStatus.PENDING and e.should_translate(self._config.filtering)
-        ]
+        return entries, progress, tracker
 
-        for entry in entries:
-            if entry.status == TranslationStatus.PENDING:
-                if not entry.should_translate(self._config.filtering):
-                    entry.mark_skipped()
-                    progress.skipped_entries += 1
-
-        self._log(f"To translate: {len(to_translate)} (skipped: {progress.skipped_entries})")
+    @contextlib.contextmanager
+    def _open_memory(self) -> Iterator[None]:
+        """Keep the translation memory open for one run (if enabled)."""
+        if not self._config.memory.enabled:
+            yield
+            return
 
-        batches = list(self._create_batches(to_translate))
-        progress.total_batches = len(batches)
-        # Reset batch counter - we're processing fresh batches from to_translate list
-        progress.current_batch = 0
+        self._memory = TranslationMemory(self._config.get_memory_file(), self._config.languages.target)
+        try:
+            yield
+        finally:
+            self._memory.close()
+            self._memory = None
 
-        self._log(
-            f"Batches: {len(batches)} (size: {self._config.batch.size}, parallel: {self._config.batch.concurrent_requests})"
-        )
+    def _build_system_prompt(self) -> str:
+        if self._prompt_builder is None:
+            from .llm_client import PromptBuilder
 
-        self._eta = ETACalculator(total_items=len(to_translate))
+            self._prompt_builder = PromptBuilder(self._config.paths.rules_dir).load()
 
-        system_prompt = self._prompt_builder.build(
+        self._system_prompt = self._prompt_builder.build(
             source_lang=self._config.languages.source,
             original_lang=self._config.languages.original,
             target_lang=self._config.languages.target,
         )
-        self._system_prompt = system_prompt
+        return self._system_prompt
+
+    async def _process_entries(
+        self,
+        entries: EntryStore,
+        progress: TranslationProgress,
+        tracker: ProgressTracker,
+        output_csv: Path,
+    ) -> TranslationProgress:
+        """Filter, deduplicate and batch pending entries, translate them and save the results."""
+        self._quarantine.clear()
+        self._tracker = tracker
+        batches, pending = self._plan_batches(entries, progress, tracker)
+        # Reset batch counter - we're processing fresh batches from to_translate list
+        progress.current_batch = 0
+
+        self._eta = ETACalculator(total_items=pending)
+
+        system_prompt = self._build_system_prompt()
         prompt_tokens = self._token_counter.count_tokens(system_prompt)
 
         if self._verbose:
@@ -403,7 +530,9 @@ class BatchProcessor:
         await self._process_all_batches(batches, entries, progress, tracker, system_prompt)
 
         tracker.save()
+        tracker.compact()
         self._save_results(entries, output_csv)
+        self._save_quarantine(output_csv)
 
         status = "INTERRUPTED" if self._shutdown_requested else "COMPLETE"
         elapsed = self._eta.format_elapsed()
@@ -422,200 +551,461 @@ class BatchProcessor:
 
         return progress
 
-    async def _process_all_batches(
+    def _plan_batches(
         self,
-        batches: list[list[TranslationEntry]],
-        all_entries: list[TranslationEntry],
+        entries: EntryStore,
         progress: TranslationProgress,
         tracker: ProgressTracker,
-        system_prompt: str,
-    ) -> None:
-        """Process all batches with concurrency control."""
+    ) -> tuple[list[list[TranslationEntry]], int]:
+        """Skip filtered entries, fill memory hits and batch the rest (one copy per duplicate).
+
+        Returns the batches and the number of entries they cover, duplicates included.
+        """
+        to_translate: list[TranslationEntry] = []
+        for entry in entries.with_status(TranslationStatus.PENDING):
+            if entry.should_translate(self._config.filtering):
+                to_translate.append(entry)
+            else:
+                entries.mark_skipped(entry)
+                progress.skipped_entries += 1
 
-        total_batches = len(batches)
-        concurrent = self._config.batch.concurrent_requests
+        if self._memory is not None:
+            to_translate = self._apply_memory(self._memory, to_translate, entries, progress, tracker)
 
-        for group_start in range(0, total_batches, concurrent):
-            if self._shutdown_requested:
-                self._log("[!] Stopping...")
-                break
+        self._log(f"To translate: {len(to_translate)} (skipped: {progress.skipped_entries})")
 
-            group_end = min(group_start + concurrent, total_batches)
-            group_batches = [
-                (i, batches[i])
-                for i in range(group_start, group_end)
-                if i >= progress.current_batch
-            ]
+        unique, self._duplicates = group_duplicates(to_translate)
+        if self._duplicates:
+            copies = len(to_translate) - len(unique)
+            self._log(f"Duplicates: {copies} copies of {len(self._duplicates)} texts, sending {len(unique)} unique")
 
-            if not group_batches:
-                continue
+        batches = self._create_batches(unique, entries)
+        progress.total_batches = len(batches)
 
-            tasks = [
-                self._process_single_batch(idx, batch, all_entries, system_prompt)
-                for idx, batch in group_batches
-            ]
+        batch_cfg = self._config.batch
+        if batch_cfg.token_packing:
+            average = len(unique) / len(batches) if batches else 0
+            sizing = f"packed to {batch_cfg.max_tokens_per_batch} tokens, avg {average:.1f} texts"
+        else:
+            sizing = f"size: {batch_cfg.size}"
+        self._log(f"Batches: {len(batches)} ({sizing}, parallel: {batch_cfg.concurrent_requests})")
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        return batches, len(to_translate)
 
-            for result in results:
-                if isinstance(result, Exception):
-                    self._log(f"[ERROR] {result}")
-                    continue
+    def _apply_memory(
+        self,
+        memory: TranslationMemory,
+        to_translate: list[TranslationEntry],
+        entries: EntryStore,
+        progress: TranslationProgress,
+        tracker: ProgressTracker,
+    ) -> list[TranslationEntry]:
+        """Fill exact translation memory hits; returns the entries still to translate.
+
+        Translations restored from the tracker are recorded first, so a memory created
+        mid-project starts with the work already done. Entries whose saved translation
+        was just rejected (error markers) are always sent again.
+        """
+        memory.add_many(
+            ((e.english, e.original, e.translated) for e in entries.with_status(TranslationStatus.TRANSLATED)),
+            replace=False,
+        )
+
+        remaining: list[TranslationEntry] = []
+        reused: dict[str, str] = {}
+        for entry in to_translate:
+            if entry.id in self._retry_ids:
+                remaining.append(entry)
+            elif (translation := memory.lookup(entry.english, entry.original)) is not None:
+                entries.mark_translated(entry, translation)
+                reused[entry.id] = translation
+                progress.translated_entries += 1
+            else:
+                remaining.append(entry)
+
+        if reused:
+            tracker.update_batch(reused)
+            self._log(f"Translation memory: {len(reused)} exact matches reused ({len(memory)} stored)")
+        return remaining
+
+    def _find_references(self, batch: list[TranslationEntry]) -> list[dict[str, str]]:
+        """Similar earlier translations for a batch, best matches first."""
+        if self._memory is None or self._config.memory.max_references == 0:
+            return []
+
+        limit = self._config.memory.max_references
+        threshold = self._config.memory.fuzzy_threshold
+        matches: dict[tuple[str, str], MemoryMatch] = {}
+        for entry in batch:
+            for match in self._memory.similar(entry.english, limit, threshold):
+                key = (match.english, match.original)
+                if key not in matches or matches[key].score < match.score:
+                    matches[key] = match
+
+        best = sorted(matches.values(), key=lambda m: m.score, reverse=True)[:limit]
+        return [match.to_dict() for match in best]
+
+    async def _process_all_batches(
+        self,
+        batches: list[list[TranslationEntry]],
+        all_entries: EntryStore,
+        progress: TranslationProgress,
+        tracker: ProgressTracker,
+        system_prompt: str,
+    ) -> None:
+        """Process all batches on a pool of ``concurrent_requests`` workers.
 
-                if not isinstance(result, BatchResult):
+        Each worker pulls the next batch as soon as its previous one finishes, so a slow
+        batch (e.g. one sitting in retry backoff) only occupies its own slot. Results are
+        committed in completion order.
+        """
+        queue: asyncio.Queue[tuple[int, list[TranslationEntry]]] = asyncio.Queue()
+        for idx, batch in enumerate(batches):
+            if idx >= progress.current_batch:
+                queue.put_nowait((idx, batch))
+
+        total_batches = len(batches)
+        workers = min(self._config.batch.concurrent_requests, queue.qsize())
+        save_every = self._config.progress.save_every_n_batches
+        delay = self._config.batch.delay_between_batches
+        isolate = self._config.batch.isolate_failures
+        completed = 0
+
+        limiter: AdaptiveConcurrency | None = None
+        if self._config.batch.adaptive_concurrency:
+            limiter = AdaptiveConcurrency(
+                self._config.batch.concurrent_requests,
+                min_limit=self._config.batch.min_concurrent_requests,
+            )
+            self._rate_limit_hits = getattr(self._llm, "rate_limit_hits", 0)
+        self._concurrency = limiter
+        cache_read_before = getattr(self._llm, "cache_read_tokens", 0)
+
+        async def worker() -> None:
+            nonlocal completed
+
+            while not self._shutdown_requested:
+                if limiter is not None:
+                    await limiter.acquire()
+                try:
+                    idx, batch = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    if limiter is not None:
+                        await limiter.release()
+                    return
+
+                result: BatchResult | None = None
+                first: BatchResult | None = None  # the controller samples only the batch's own request
+                try:
+                    result = first = await self._process_single_batch(idx, batch, all_entries, system_prompt)
+                    if not result.success and not result.systemic and isolate and len(batch) > 1:
+                        result = await self._isolate_failures(result, batch, all_entries, system_prompt)
+                except Exception as e:
+                    self._log(f"[ERROR] {e}")
+                finally:
+                    if limiter is not None:
+                        self._record_outcome(limiter, first)
+                        await limiter.release()
+
+                if result is None:
                     continue
 
-                batch = batches[result.batch_idx]
+                self._commit_result(
+                    result, batch, all_entries, progress, tracker=tracker, total_batches=total_batches
+                )
+                completed += 1
+                if completed % save_every == 0:
+                    tracker.save()
 
-                if result.success:
-                    for entry in batch:
-                        if entry.id in result.translations:
-                            entry.mark_translated(result.translations[entry.id])
-                            progress.translated_entries += 1
+                if delay > 0 and not queue.empty():
+                    await asyncio.sleep(delay)
 
-                    tracker.update_batch(result.translations)
-                    progress.current_batch = result.batch_idx + 1
-                else:
-                    for entry in batch:
-                        entry.mark_error(result.error)
-                        progress.error_entries += 1
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        self._token_counter.stats.cache_read_tokens += getattr(self._llm, "cache_read_tokens", 0) - cache_read_before
 
-                self._eta.update(progress.translated_entries)
+        if self._shutdown_requested:
+            self._log("[!] Stopping...")
 
-                pct = progress.progress_percent
-                eta_str = self._eta.format_eta()
-                elapsed = self._eta.format_elapsed()
-                status = "OK" if result.success else "FAIL"
-                warn_str = f" [{result.length_warnings} long]" if result.length_warnings else ""
+    def _record_outcome(self, limiter: AdaptiveConcurrency, result: BatchResult | None) -> None:
+        """Feed a finished batch to the concurrency controller."""
+        hits = getattr(self._llm, "rate_limit_hits", 0)
+        if hits > self._rate_limit_hits:
+            self._rate_limit_hits = hits
+            limiter.record_congestion("rate limited")
+        elif result is not None and result.success:
+            limiter.record_success(result.latency)
 
-                self._log(
-                    f"  Batch {result.batch_idx + 1}/{total_batches}: {status}{warn_str} "
-                    f"({result.duration:.1f}s) | "
-                    f"{pct:.1f}% | ETA: {eta_str} | Elapsed: {elapsed}"
+    def _commit_result(
+        self,
+        result: BatchResult,
+        batch: list[TranslationEntry],
+        all_entries: EntryStore,
+        progress: TranslationProgress,
+        *,
+        tracker: ProgressTracker,
+        total_batches: int,
+    ) -> None:
+        """Apply a finished batch to entries, progress and tracker, then log it."""
+        if result.success:
+            translations = dict(result.translations)
+            for entry in batch:
+                if (translation := result.translations.get(entry.id)) is None:
+                    continue
+                for target in (entry, *self._duplicates.get(entry.id, ())):
+                    all_entries.mark_translated(target, translation)
+                    translations[target.id] = translation
+                    progress.translated_entries += 1
+
+            tracker.update_batch(translations)
+            if self._memory is not None:
+                self._memory.add_many(
+                    (entry.english, entry.original, translation)
+                    for entry in batch
+                    if (translation := result.translations.get(entry.id)) is not None
+                    and not ErrorMarkers.contains_error(translation)
                 )
+            progress.current_batch = max(progress.current_batch, result.batch_idx + 1)
+        for entry in batch:
+            if result.success and entry.id not in result.failures:
+                continue
+            error = result.failures.get(entry.id, result.error)
+            for target in (entry, *self._duplicates.get(entry.id, ())):
+                all_entries.mark_error(target, error)
+                progress.error_entries += 1
 
-                if self._on_progress:
-                    self._on_progress(progress)
+        self._eta.update(progress.translated_entries)
 
-            tracker.save()
+        pct = progress.progress_percent
+        eta_str = self._eta.format_eta()
+        elapsed = self._eta.format_elapsed()
+        if result.success and result.failures:
+            status = f"PARTIAL ({len(result.failures)} failed)"
+        else:
+            status = "OK" if result.success else "FAIL"
+        warn_str = f" [{result.length_warnings} long]" if result.length_warnings else ""
+        limit_str = f" | Parallel: {self._concurrency.limit}" if self._concurrency else ""
 
-            if self._shutdown_requested:
-                break
+        self._log(
+            f"  Batch {result.batch_idx + 1}/{total_batches}: {status}{warn_str} "
+            f"({result.duration:.1f}s) | "
+            f"{pct:.1f}% | ETA: {eta_str} | Elapsed: {elapsed}{limit_str}"
+        )
 
-            if self._config.batch.delay_between_batches > 0:
-                await asyncio.sleep(self._config.batch.delay_between_batches)
+        if self._on_progress:
+            self._on_progress(progress)
 
     async def _process_single_batch(
         self,
         batch_idx: int,
         batch: list[TranslationEntry],
-        all_entries: list[TranslationEntry],
+        all_entries: EntryStore,
         system_prompt: str,
     ) -> BatchResult:
         """Process single batch."""
+        from .llm_client import model_latency, reset_model_latency
 
-        async with self._semaphore:  # type: ignore
-            if self._shutdown_requested:
-                return BatchResult(batch_idx, {}, False, "Shutdown")
-
-            start_time = time.time()
-            length_warnings = 0
-
-            try:
-                ctx_before = self._get_context_before(batch, all_entries)
-                ctx_after = self._get_context_after(batch, all_entries)
-                texts = [e.to_dict() for e in batch]
-
-                if self._verbose:
-                    self._log(f"    [Batch {batch_idx + 1}] Sending {len(texts)} texts:")
-                    for i, t in enumerate(texts[:3]):
-                        en = t["english"][:50] + "..." if len(t["english"]) > 50 else t["english"]
-                        self._log(f"      [{i + 1}] EN: {en}")
-                    if len(texts) > 3:
-                        self._log(f"      ... +{len(texts) - 3} more")
-
-                user_message = self._build_user_message(texts, ctx_before, ctx_after)
-                translations = await self._llm.translate_batch(  # type: ignore
-                    texts, system_prompt, ctx_before, ctx_after
-                )
+        if self._shutdown_requested:
+            return BatchResult(batch_idx, {}, False, "Shutdown", systemic=True)
 
-                response_text = str(translations)
-                input_tokens, output_tokens = self._token_counter.record_batch(
-                    self._system_prompt, user_message, response_text
-                )
+        start_time = time.time()
+        reset_model_latency()
+        length_warnings = 0
+        streamed: dict[str, str] = {}  # Items that arrived before the request finished
 
-                if self._verbose:
-                    self._log(f"      Tokens: in={input_tokens}, out={output_tokens}")
+        try:
+            ctx_before = self._get_context_before(batch, all_entries)
+            ctx_after = self._get_context_after(batch, all_entries)
+            texts = [e.to_dict() for e in batch]
+            references = self._find_references(batch)
+
+            if self._verbose:
+                self._log(f"    [Batch {batch_idx + 1}] Sending {len(texts)} texts:")
+                for i, t in enumerate(texts[:3]):
+                    en = t["english"][:50] + "..." if len(t["english"]) > 50 else t["english"]
+                    self._log(f"      [{i + 1}] EN: {en}")
+                if len(texts) > 3:
+                    self._log(f"      ... +{len(texts) - 3} more")
+
+            user_message = self._build_user_message(texts, ctx_before, ctx_after, references)
+            kwargs = {}
+            if self._config.llm.streaming:
+                kwargs["on_item"] = lambda index, translation: self._stream_item(batch, index, translation, streamed)
+            translations = await self._llm.translate_batch(  # type: ignore
+                texts, system_prompt, ctx_before, ctx_after, references=references, **kwargs
+            )
 
-                for entry, translation in zip(batch, translations):
-                    is_ok, ratio = check_translation_length(
-                        entry.english, entry.original, translation
-                    )
-                    if not is_ok:
-                        length_warnings += 1
+            if all(ErrorMarkers.is_error_marker(t) for t in translations):
+                raise ValueError("Unparseable response")
 
-                if self._verbose:
-                    self._log(
-                        f"    [Batch {batch_idx + 1}] Received {len(translations)} translations:"
-                    )
-                    for i, tr in enumerate(translations[:3]):
-                        tr_short = tr[:50] + "..." if len(tr) > 50 else tr
-                        self._log(f"      [{i + 1}] RU: {tr_short}")
-                    if len(translations) > 3:
-                        self._log(f"      ... +{len(translations) - 3} more")
+            response_text = str(translations)
+            input_tokens, output_tokens = self._token_counter.record_batch(
+                self._system_prompt, user_message, response_text
+            )
 
-                result_dict = {
-                    entry.id: translation for entry, translation in zip(batch, translations)
-                }
+            if self._verbose:
+                self._log(f"      Tokens: in={input_tokens}, out={output_tokens}")
 
-                duration = time.time() - start_time
+            for entry, translation in zip(batch, translations):
+                is_ok, ratio = check_translation_length(
+                    entry.english, entry.original, translation
+                )
+                if not is_ok:
+                    length_warnings += 1
+
+            if self._verbose:
+                self._log(
+                    f"    [Batch {batch_idx + 1}] Received {len(translations)} translations:"
+                )
+                for i, tr in enumerate(translations[:3]):
+                    tr_short = tr[:50] + "..." if len(tr) > 50 else tr
+                    self._log(f"      [{i + 1}] RU: {tr_short}")
+                if len(translations) > 3:
+                    self._log(f"      ... +{len(translations) - 3} more")
+
+            result_dict = {
+                entry.id: translation for entry, translation in zip(batch, translations)
+            }
+
+            duration = time.time() - start_time
+            # Cache hits and clients without timing fall back to the whole batch
+            latency = model_latency() or duration
+            return BatchResult(
+                batch_idx,
+                result_dict,
+                True,
+                duration=duration,
+                latency=latency,
+                length_warnings=length_warnings,
+            )
+
+        except Exception as e:
+            duration = time.time() - start_time
+            error_msg = str(e)[:100]
+            logger.error(f"Batch {batch_idx + 1} failed: {e}")
+            streamed = self._aligned_items(e, batch, streamed)
+            if streamed:
+                # Keep what arrived; the rest is marked failed and retried next run
+                failures = {entry.id: error_msg for entry in batch if entry.id not in streamed}
                 return BatchResult(
-                    batch_idx, result_dict, True, duration=duration, length_warnings=length_warnings
+                    batch_idx, streamed, True, error_msg, duration, systemic=_is_systemic(e), failures=failures
                 )
+            return BatchResult(batch_idx, {}, False, error_msg, duration, systemic=_is_systemic(e))
+
+    def _aligned_items(
+        self, error: Exception, batch: list[TranslationEntry], streamed: dict[str, str]
+    ) -> dict[str, str]:
+        """Translations of a failed batch that can be kept.
+
+        For an incomplete response these are exactly the leading items the client vouches
+        for; anything else streamed into the tracker is taken back out.
+        """
+        from .llm_client import IncompleteResponseError
+
+        if not isinstance(error, IncompleteResponseError):
+            return streamed
+
+        kept = {
+            entry.id: translation
+            for entry, translation in zip(batch, error.items)
+            if not ErrorMarkers.contains_error(translation)
+        }
+        if self._tracker is not None:
+            for entry in batch:
+                if entry.id in streamed and entry.id not in kept:
+                    for target in (entry, *self._duplicates.get(entry.id, ())):
+                        self._tracker.remove(target.id)
+        return kept
+
+    def _stream_item(
+        self, batch: list[TranslationEntry], index: int, translation: str, streamed: dict[str, str]
+    ) -> None:
+        """Journal a streamed translation right away, before its batch completes."""
+        if index >= len(batch) or ErrorMarkers.contains_error(translation):
+            return
+        entry = batch[index]
+        streamed[entry.id] = translation
+        if self._tracker is not None:
+            for target in (entry, *self._duplicates.get(entry.id, ())):
+                self._tracker.update(target.id, translation)
+
+    async def _isolate_failures(
+        self,
+        failed: BatchResult,
+        batch: list[TranslationEntry],
+        all_entries: EntryStore,
+        system_prompt: str,
+    ) -> BatchResult:
+        """Bisect a failed batch until the failing entries are single.
+
+        Halves that succeed keep their translations; single entries that still fail are
+        recorded in ``failures`` and quarantined. A systemic failure (quota, outage) stops
+        the search and fails everything not yet translated.
+        """
+        self._log(f"  Batch {failed.batch_idx + 1}: failed ({failed.error}), isolating {len(batch)} texts")
+        start_time = time.time()
+        translations: dict[str, str] = {}
+        failures: dict[str, str] = {}
+        isolated: list[TranslationEntry] = []
+        length_warnings = 0
+        systemic = False
+        pending = [batch[: len(batch) // 2], batch[len(batch) // 2 :]]
+
+        while pending:
+            part = pending.pop(0)
+            if systemic:
+                failures.update((entry.id, failed.error) for entry in part)
+                continue
 
-            except Exception as e:
-                duration = time.time() - start_time
-                error_msg = str(e)[:100]
-                logger.error(f"Batch {batch_idx + 1} failed: {e}")
-                return BatchResult(batch_idx, {}, False, error_msg, duration)
+            result = await self._process_single_batch(failed.batch_idx, part, all_entries, system_prompt)
+            if result.success:
+                translations.update(result.translations)
+                failures.update(result.failures)  # Cut-off stream: not isolated, retried next run
+                length_warnings += result.length_warnings
+            elif result.systemic:
+                systemic = True
+                failed = result
+                failures.update((entry.id, result.error) for entry in part)
+            elif len(part) == 1:
+                failures[part[0].id] = result.error
+                isolated.append(part[0])
+            else:
+                pending[:0] = [part[: len(part) // 2], part[len(part) // 2 :]]
+
+        if not systemic:
+            for entry in isolated:
+                self._quarantine[entry.id] = (entry, failures[entry.id])
+
+        return BatchResult(
+            failed.batch_idx,
+            translations,
+            bool(translations),
+            failed.error,
+            failed.duration + time.time() - start_time,
+            length_warnings,
+            systemic=systemic,
+            failures=failures,
+        )
 
     def _load_entries(self, source_csv: Path, original_csv: Path) -> list[TranslationEntry]:
-        """Load entries from CSV files."""
-        english: dict[str, str] = {}
-        with open(source_csv, encoding="utf-8", newline="") as f:
-            reader = csv.reader(f, delimiter=";")
-            header = next(reader, None)
-            if not header:
-                return []
+        """Load entries from the source/original tables (string store or CSV)."""
+        table = open_table(source_csv)
+        if table is None:
+            return []
 
-            try:
-                id_idx = header.index("ID")
-                text_idx = header.index("OriginalText")
-            except ValueError:
+        with table:
+            if "ID" not in table.columns or "OriginalText" not in table.columns:
                 logger.error("Required columns not found")
                 return []
-
-            for row in reader:
-                if len(row) > max(id_idx, text_idx):
-                    english[row[id_idx]] = row[text_idx]
+            english = table.to_dict("OriginalText")
 
         original: dict[str, str] = {}
-        if original_csv.exists():
-            try:
-                with open(original_csv, encoding="utf-8", newline="") as f:
-                    reader = csv.reader(f, delimiter=";")
-                    header = next(reader, None)
-                    if header:
-                        try:
-                            id_idx = header.index("ID")
-                            text_idx = header.index("OriginalText")
-                            for row in reader:
-                                if len(row) > max(id_idx, text_idx):
-                                    original[row[id_idx]] = row[text_idx]
-                        except ValueError:
-                            pass
-            except Exception as e:
-                logger.warning(f"Failed to load original: {e}")
+        try:
+            if (table := open_table(original_csv)) is not None:
+                with table:
+                    if "ID" in table.columns and "OriginalText" in table.columns:
+                        original = table.to_dict("OriginalText")
+        except Exception as e:
+            logger.warning(f"Failed to load original: {e}")
 
         entries = [
             TranslationEntry(
@@ -636,10 +1026,17 @@ class BatchProcessor:
         texts: list[dict[str, str]],
         ctx_before: list[dict[str, str]],
         ctx_after: list[dict[str, str]],
+        references: list[dict[str, str]] | None = None,
     ) -> str:
         """Build user message for token counting."""
         parts = []
 
+        for item in references or ():
+            parts.append(f"EN: {item.get('english', '')}")
+            if zh := item.get("original"):
+                parts.append(f"ZH: {zh}")
+            parts.append(f"RU: {item.get('translated', '')}")
+
         for item in ctx_before:
             parts.append(f"EN: {item.get('english', '')}")
             if zh := item.get("original"):
@@ -655,32 +1052,38 @@ class BatchProcessor:
 
         return "\n".join(parts)
 
-    def _create_batches(self, entries: list[TranslationEntry]) -> Iterator[list[TranslationEntry]]:
-        """Create batches from entries."""
-        batch_size = self._config.batch.size
-        for i in range(0, len(entries), batch_size):
-            yield entries[i : i + batch_size]
+    def _create_batches(
+        self,
+        entries: list[TranslationEntry],
+        all_entries: EntryStore,
+    ) -> list[list[TranslationEntry]]:
+        """Create batches from entries (token-packed or fixed size)."""
+        batch_cfg = self._config.batch
+        if not batch_cfg.token_packing:
+            return [entries[i : i + batch_cfg.size] for i in range(0, len(entries), batch_cfg.size)]
+
+        planner = BatchPlanner(
+            self._token_counter,
+            max_tokens=batch_cfg.max_tokens_per_batch,
+            max_output_tokens=self._config.llm.max_tokens,
+            max_entries=batch_cfg.max_entries_per_batch,
+            context_items=batch_cfg.context_before + batch_cfg.context_after,
+        )
+        return planner.plan(entries, all_entries.position)
 
     def _get_context_before(
         self,
         batch: list[TranslationEntry],
-        all_entries: list[TranslationEntry],
+        all_entries: EntryStore,
     ) -> list[dict[str, str]]:
         """Get translated context before batch."""
         if not batch:
             return []
 
-        first_id = batch[0].id
         count = self._config.batch.context_before
 
-        idx = next((i for i, e in enumerate(all_entries) if e.id == first_id), None)
-
-        if idx is None or idx == 0:
-            return []
-
         context = []
-        for i in range(max(0, idx - count), idx):
-            entry = all_entries[i]
+        for entry in all_entries.before(batch[0].id, count):
             if entry.status == TranslationStatus.TRANSLATED:
                 context.append(
                     {
@@ -696,33 +1099,25 @@ class BatchProcessor:
     def _get_context_after(
         self,
         batch: list[TranslationEntry],
-        all_entries: list[TranslationEntry],
+        all_entries: EntryStore,
     ) -> list[dict[str, str]]:
         """Get preview context after batch."""
         if not batch:
             return []
 
-        last_id = batch[-1].id
         count = self._config.batch.context_after
 
-        idx = next((i for i, e in enumerate(all_entries) if e.id == last_id), None)
-
-        if idx is None or idx >= len(all_entries) - 1:
-            return []
-
         return [
             {"id": e.id, "original": e.original, "english": e.english}
-            for e in all_entries[idx + 1 : idx + 1 + count]
+            for e in all_entries.after(batch[-1].id, count)
         ]
 
-    def _save_results(self, entries: list[TranslationEntry], output_csv: Path) -> None:
-        """Save results to CSV."""
+    def _save_results(self, entries: EntryStore, output_csv: Path) -> None:
+        """Save results to the output table (CSV and/or string store)."""
         output_csv.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_csv, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f, delimiter=";")
-            writer.writerow(["ID", "Original", "English", "Russian", "Status"])
-
+        header = ["ID", "Original", "English", "Russian", "Status"]
+        with TableWriter(output_csv, header, csv_file=self._config.storage.write_csv) as writer:
             for entry in entries:
                 writer.writerow(
                     [
@@ -736,6 +1131,171 @@ class BatchProcessor:
 
         self._log(f"Saved: {output_csv}")
 
+    def _save_quarantine(self, output_csv: Path) -> None:
+        """Write the isolated failing texts next to the output, or remove a stale list."""
+        path = output_csv.with_name(f"{output_csv.stem}_quarantine.csv")
+        if not self._quarantine:
+            path.unlink(missing_ok=True)
+            return
+
+        with TableWriter(path, ["ID", "English", "Original", "Error"], store=False) as writer:
+            for entry, error in self._quarantine.values():
+                for target in (entry, *self._duplicates.get(entry.id, ())):
+                    writer.writerow([target.id, target.english, target.original, error])
+
+        self._log(f"Quarantined: {len(self._quarantine)} texts that fail on their own -> {path}")
+
+    def export_bulk(
+        self,
+        source_csv: Path,
+        original_csv: Path,
+        requests_file: Path,
+        manifest_file: Path,
+        *,
+        fmt: str = "openai",
+        resume: bool = True,
+    ) -> int:
+        """Write the pending batches as a provider batch-API request file instead of sending them.
+
+        The manifest maps each request back to its entries for ``ingest_bulk``.
+        Returns the number of requests written.
+        """
+        from .bulk_jobs import BulkManifest, request_line
+        from .llm_client import LLMClient
+
+        session = self._load_session(source_csv, original_csv, resume)
+        if session is None:
+            return 0
+        entries, progress, tracker = session
+
+        llm = self._config.llm
+        manifest = BulkManifest(progress.source_file_hash, fmt, llm.model)
+        with self._open_memory():
+            batches, _ = self._plan_batches(entries, progress, tracker)
+            system_prompt = self._build_system_prompt()
+
+            requests_file.parent.mkdir(parents=True, exist_ok=True)
+            temp = requests_file.with_suffix(".tmp")
+            with open(temp, "w", encoding="utf-8") as f:
+                for idx, batch in enumerate(batches):
+                    custom_id = f"batch-{idx + 1:05d}"
+                    user_message = LLMClient._build_message(
+                        [e.to_dict() for e in batch],
+                        self._get_context_before(batch, entries),
+                        self._get_context_after(batch, entries),
+                        self._find_references(batch),
+                    )
+                    request = request_line(
+                        fmt,
+                        custom_id,
+                        model=llm.model,
+                        temperature=llm.temperature,
+                        max_tokens=llm.max_tokens,
+                        system_prompt=system_prompt,
+                        user_message=user_message,
+                        prompt_caching=llm.prompt_caching,
+                    )
+                    f.write(json.dumps(request, ensure_ascii=False) + "\n")
+                    manifest.requests[custom_id] = [e.id for e in batch]
+            temp.replace(requests_file)
+
+        manifest.copies = {rep: [copy.id for copy in copies] for rep, copies in self._duplicates.items()}
+        manifest.save(manifest_file)
+        tracker.save()  # Translation memory hits
+        self._log(f"Bulk requests: {len(batches)} ({fmt} format) -> {requests_file}")
+        return len(batches)
+
+    def ingest_bulk(
+        self,
+        source_csv: Path,
+        original_csv: Path,
+        output_csv: Path,
+        results_file: Path,
+        manifest_file: Path,
+        *,
+        dry_run: bool = False,
+    ) -> TranslationProgress:
+        """Apply a batch-API results file (OpenAI or Anthropic) written for ``export_bulk``.
+
+        ``dry_run`` parses and counts the results without touching the output, progress or
+        memory (progress is loaded read-only); it is the only way ``bulk-echo`` stand-in
+        results are accepted.
+        """
+        from .bulk_jobs import BulkManifest, read_results
+
+        manifest = BulkManifest.load(manifest_file)
+        # Before anything is loaded: a new source would reset the saved progress
+        if source_digest(source_csv) != manifest.source_hash:
+            raise ValueError(f"{manifest_file.name} was made for a different version of {source_csv.name}")
+        session = self._load_session(source_csv, original_csv, resume=True, read_only=dry_run)
+        if session is None:
+            return TranslationProgress()
+        entries, progress, tracker = session
+
+        pending = entries.with_status(TranslationStatus.PENDING)
+        skipped = [entry for entry in pending if not entry.should_translate(self._config.filtering)]
+        for entry in skipped:
+            entries.mark_skipped(entry)
+        # Counted again from this results file (skips were already counted by export_bulk)
+        progress.skipped_entries = len(skipped)
+        progress.error_entries = 0
+
+        self._duplicates = {
+            rep: [copy for copy_id in copy_ids if (copy := entries.get(copy_id)) is not None]
+            for rep, copy_ids in manifest.copies.items()
+        }
+        order = {custom_id: idx for idx, custom_id in enumerate(manifest.requests)}
+        total = len(order)
+        self._eta = ETACalculator(total_items=sum(len(ids) for ids in manifest.requests.values()))
+        progress.total_batches = total
+        progress.current_batch = 0
+
+        answered = 0
+        with contextlib.nullcontext() if dry_run else self._open_memory():
+            for custom_id, content, error in read_results(results_file, allow_echo=dry_run):
+                if (ids := manifest.requests.get(custom_id)) is None:
+                    self._log(f"  Unknown request {custom_id}, skipped")
+                    continue
+                result = self._parse_bulk_result(order[custom_id], ids, content, error)
+                batch = [
+                    sent
+                    for entry_id in ids
+                    if (sent := entries.get(entry_id)) is not None and sent.status != TranslationStatus.TRANSLATED
+                ]
+                self._commit_result(result, batch, entries, progress, tracker=tracker, total_batches=total)
+                answered += 1
+
+        if not dry_run:
+            tracker.save()
+            tracker.compact()
+            self._save_results(entries, output_csv)
+
+        self._log(f"\n[{'DRY RUN' if dry_run else 'INGESTED'}] {answered}/{total} requests")
+        if answered < total:
+            self._log(f"  {total - answered} requests have no result yet - their texts stay pending")
+        self._log(
+            f"  Translated: {progress.translated_entries}, Skipped: {progress.skipped_entries}, Errors: {progress.error_entries}"
+        )
+        return progress
+
+    @staticmethod
+    def _parse_bulk_result(batch_idx: int, ids: list[str], content: str | None, error: str) -> BatchResult:
+        """Parse one batch-API response like a live one."""
+        from .llm_client import IncompleteResponseError, LLMClient
+
+        if content is None:
+            return BatchResult(batch_idx, {}, False, error[:100])
+        try:
+            translations = LLMClient._parse_response(content, len(ids))
+        except IncompleteResponseError as e:
+            kept = dict(zip(ids, e.items or []))
+            failures = {entry_id: str(e) for entry_id in ids if entry_id not in kept}
+            return BatchResult(batch_idx, kept, bool(kept), str(e), failures=failures)
+
+        if all(ErrorMarkers.is_error_marker(t) for t in translations):
+            return BatchResult(batch_idx, {}, False, "Unparseable response")
+        return BatchResult(batch_idx, dict(zip(ids, translations)), True)
+
     def process_sync(
         self,
         source_csv: Path,
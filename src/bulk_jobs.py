@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("openai", "anthropic")
+
+_TEXT_HEADER = re.compile(r"^\[\d+\]$")
+
+
+@dataclass(slots=True)
+class BulkManifest:
+    """What a bulk request file contains: request id -> entry ids, in prompt order.
+
+    ``copies`` maps a sent entry to the duplicates that get the same translation, and
+    ``source_hash`` ties the file to the source table it was planned from.
+    """
+
+    source_hash: str
+    format: str
+    model: str
+    requests: dict[str, list[str]] = field(default_factory=dict)
+    copies: dict[str, list[str]] = field(default_factory=dict)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(".tmp")
+        temp.write_text(
+            json.dumps(
+                {
+                    "source_hash": self.source_hash,
+                    "format": self.format,
+                    "model": self.model,
+                    "requests": self.requests,
+                    "copies": self.copies,
+                },
+                ensure_ascii=False,
+                indent=1,
+            ),
+            encoding="utf-8",
+        )
+        temp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            source_hash=data["source_hash"],
+            format=data["format"],
+            model=data["model"],
+            requests=data.get("requests", {}),
+            copies=data.get("copies", {}),
+        )
+
+
+def bulk_paths(bulk_dir: Path, source_csv: Path) -> tuple[Path, Path, Path]:
+    """Default (requests, manifest, results) files for a source table."""
+    stem = Path(source_csv).stem
+    return (
+        bulk_dir / f"{stem}_requests.jsonl",
+        bulk_dir / f"{stem}_manifest.json",
+        bulk_dir / f"{stem}_results.jsonl",
+    )
+
+
+def echo_results_path(results_file: Path) -> Path:
+    """Scratch file for ``echo_results``, kept apart from the real results file."""
+    return results_file.with_name(results_file.stem.removesuffix("_results") + "_echo_results.jsonl")
+
+
+def default_format(provider: str) -> str:
+    return "anthropic" if provider.lower() == "anthropic" else "openai"
+
+
+def request_line(
+    fmt: str,
+    custom_id: str,
+    *,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    user_message: str,
+    prompt_caching: bool = True,
+) -> dict:
+    """One request of a batch job.
+
+    OpenAI: a line of the uploaded ``/v1/chat/completions`` batch file. Anthropic: one
+    element of the Message Batches ``requests`` list (one per line here).
+    """
+    match fmt:
+        case "openai":
+            return {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_message},
+                    ],
+                },
+            }
+        case "anthropic":
+            system: dict = {"type": "text", "text": system_prompt}
+            if prompt_caching:
+                system["cache_control"] = {"type": "ephemeral"}
+            return {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    "system": [system],
+                    "messages": [{"role": "user", "content": user_message}],
+                },
+            }
+        case _:
+            raise ValueError(f"Unknown bulk format: {fmt} (expected one of {', '.join(FORMATS)})")
+
+
+def read_results(path: Path, *, allow_echo: bool = False) -> Iterator[tuple[str, str | None, str]]:
+    """(custom_id, response text or None, error) per line of an OpenAI or Anthropic results file.
+
+    Results written by ``echo_results`` are refused unless ``allow_echo`` is set: they hold
+    the English texts, not translations.
+    """
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                custom_id = record["custom_id"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logger.warning(f"{Path(path).name}:{number}: not a batch result, skipped")
+                continue
+            if record.get("echo") and not allow_echo:
+                raise ValueError(f"{Path(path).name} holds 'bulk-echo' stand-in results, not translations")
+            yield custom_id, *_result_content(record)
+
+
+def _result_content(record: dict) -> tuple[str | None, str]:
+    if "result" in record:  # Anthropic
+        result = record["result"] or {}
+        if result.get("type") != "succeeded":
+            error = result.get("error") or {}
+            return None, error.get("message") or str(result.get("type", "failed"))
+        blocks = result.get("message", {}).get("content", [])
+        return "".join(b.get("text", "") for b in blocks if b.get("type") == "text"), ""
+
+    # OpenAI
+    if error := record.get("error"):
+        return None, error.get("message", str(error)) if isinstance(error, dict) else str(error)
+    response = record.get("response") or {}
+    if response.get("status_code", 200) != 200:
+        body_error = (response.get("body") or {}).get("error") or {}
+        return None, body_error.get("message") or f"HTTP {response.get('status_code')}"
+    choices = (response.get("body") or {}).get("choices") or [{}]
+    return choices[0].get("message", {}).get("content") or "", ""
+
+
+def echo_results(requests_file: Path, results_file: Path) -> int:
+    """Local stand-in for a batch endpoint: answer each request with its English texts.
+
+    Writes a results file in the request file's format, so ``translate --bulk`` and
+    ``ingest --dry-run`` can be tried end to end without an API. Every record is marked
+    ``"echo": true`` so a real ingest refuses it. Returns the number of results.
+    """
+    count = 0
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(requests_file, encoding="utf-8") as src, open(results_file, "w", encoding="utf-8") as dst:
+        for line in src:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            if "params" in request:
+                message = request["params"]["messages"][-1]["content"]
+                content = json.dumps(_echo_texts(message), ensure_ascii=False)
+                result = {
+                    "custom_id": request["custom_id"],
+                    "echo": True,
+                    "result": {
+                        "type": "succeeded",
+                        "message": {"role": "assistant", "content": [{"type": "text", "text": content}]},
+                    },
+                }
+            else:
+                message = request["body"]["messages"][-1]["content"]
+                content = json.dumps(_echo_texts(message), ensure_ascii=False)
+                result = {
+                    "custom_id": request["custom_id"],
+                    "echo": True,
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+                    },
+                    "error": None,
+                }
+            dst.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def _echo_texts(user_message: str) -> list[str]:
+    """English texts of the TRANSLATE section of a user message (see LLMClient._build_message)."""
+    texts: list[str] = []
+    english: list[str] | None = None  # lines of the current EN text while it is being read
+
+    def close(separated: bool) -> None:
+        # An item without ZH ends with one blank separator line; any before it are the text's own
+        if english is not None:
+            texts[-1] = "\n".join(english[:-1] if separated and len(english) > 1 else english)
+
+    in_section = False
+    awaiting = False
+    for line in user_message.split("\n"):
+        if line.startswith("=== "):
+            close(separated=True)
+            english, awaiting = None, False
+            in_section = line.startswith("=== TRANSLATE")
+        elif not in_section:
+            continue
+        elif _TEXT_HEADER.match(line):
+            close(separated=True)
+            english, awaiting = None, True
+            texts.append("")
+        elif awaiting and line.startswith("EN: "):
+            english, awaiting = [line[4:]], False
+        elif english is not None and line.startswith("ZH: "):
+            close(separated=False)
+            english = None
+        elif english is not None:
+            english.append(line)
+    close(separated=True)
+    return texts
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests.
+
+    Starts low and grows (+1 per success until the first congestion signal, then +1 per
+    ``limit`` successes). A rate-limit hit, or a window p95 latency above
+    ``latency_factor`` times the best window seen, cuts the limit by ``decrease``. After a
+    cut, signals are ignored until the requests already in flight have completed, so one
+    burst of 429s counts once.
+
+    Workers call ``record_*`` before ``release``, which wakes waiters to re-check the limit.
+    """
+
+    __slots__ = (
+        "_baseline_p95",
+        "_cond",
+        "_cooldown",
+        "_latencies",
+        "_limit",
+        "_slow_start",
+        "decrease",
+        "in_flight",
+        "latency_factor",
+        "max_limit",
+        "min_limit",
+    )
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        initial: int | None = None,
+        decrease: float = 0.5,
+        latency_factor: float = 2.0,
+        window: int = 40,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.in_flight = 0
+        start = initial if initial is not None else min(self.max_limit, max(self.min_limit, 2))
+        self._limit = float(max(self.min_limit, min(start, self.max_limit)))
+        self._slow_start = True
+        self._cooldown = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._baseline_p95: float | None = None
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """A request finished normally after ``latency`` seconds."""
+        if self._cooldown:
+            self._cooldown -= 1
+
+        self._latencies.append(latency)
+        if len(self._latencies) == self._latencies.maxlen:
+            p95 = sorted(self._latencies)[int(len(self._latencies) * 0.95) - 1]
+            if self._baseline_p95 is None or p95 < self._baseline_p95:
+                self._baseline_p95 = p95
+            elif p95 > self._baseline_p95 * self.latency_factor:
+                self.record_congestion(f"p95 latency {p95:.1f}s (baseline {self._baseline_p95:.1f}s)")
+                return
+
+        self._limit = min(self.max_limit, self._limit + (1.0 if self._slow_start else 1.0 / self._limit))
+
+    def record_congestion(self, reason: str) -> None:
+        """Rate limit or latency signal: cut the limit (once per cooldown)."""
+        if self._cooldown:
+            return
+        old = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self._slow_start = False
+        self._cooldown = max(1, self.in_flight)
+        self._latencies.clear()
+        if self.limit != old:
+            logger.info(f"Concurrency {old} -> {self.limit}: {reason}")
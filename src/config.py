@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import fnmatch
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Literal, Self
 
 import yaml
 from dotenv import load_dotenv
@@ -69,6 +70,23 @@ class LanguagesConfig(BaseModel):
         }
 
 
+class RateLimitConfig(BaseModel):
+    """Provider request/token limits (per minute, 0 = unlimited)."""
+
+    requests_per_minute: int = Field(default=30, ge=0)
+    tokens_per_minute: int = Field(default=0, ge=0)
+
+
+class BackendConfig(BaseModel):
+    """One backend of an LLM pool; unset fields fall back to the main llm settings."""
+
+    provider: str | None = None
+    model: str | None = None
+    api_key_env: str | None = None  # Env var holding this backend's key (default: the provider's usual one)
+    weight: float = Field(default=1.0, gt=0)
+    rate_limit: RateLimitConfig | None = None
+
+
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
 
@@ -79,12 +97,47 @@ class LLMConfig(BaseModel):
     timeout: int = Field(default=120, gt=0)
     max_retries: int = Field(default=3, ge=0)
     retry_delay: int = Field(default=5, gt=0)
+    prompt_caching: bool = True  # Mark the system prompt as cacheable (Anthropic, Gemini via OpenRouter)
+    streaming: bool = False  # Stream responses; translations are kept as they arrive
+    cache: bool = True  # Reuse responses to identical requests
+    cache_dir: Path = Path("./data/llm_cache")
+    cache_max_mb: int = Field(default=256, gt=0)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    rate_limits: dict[str, RateLimitConfig] = Field(default_factory=dict)  # "provider/model" glob -> limits
+    backends: list[BackendConfig] = Field(default_factory=list)  # Non-empty: load-balance over these
 
     @property
     def is_free_tier(self) -> bool:
         """Check if using free tier model."""
         return ":free" in self.model.lower()
 
+    def limits(self) -> RateLimitConfig:
+        """Rate limits for the configured model: first matching override, else the default."""
+        name = f"{self.provider}/{self.model}"
+        for pattern, limits in self.rate_limits.items():
+            if fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(self.model, pattern):
+                return limits
+        return self.rate_limit
+
+
+class ExtractionConfig(BaseModel):
+    """Game archive extraction configuration."""
+
+    workers: int = Field(default=4, ge=1)  # Threads for block decompression/compression
+    keep_all_dat: bool = False  # Write .dat files for every language (autopatch needs only the source)
+
+
+class StorageConfig(BaseModel):
+    """Storage of the extracted/translated tables."""
+
+    # csv: CSV files plus a .wst string store next to each (commands load the store)
+    # store: .wst only; use `export-csv` when a CSV is needed
+    backend: Literal["csv", "store"] = "csv"
+
+    @property
+    def write_csv(self) -> bool:
+        return self.backend == "csv"
+
 
 class BatchConfig(BaseModel):
     """Batch processing configuration."""
@@ -92,9 +145,23 @@ class BatchConfig(BaseModel):
     size: int = Field(default=15, gt=0, le=100)
     context_before: int = Field(default=3, ge=0)
     context_after: int = Field(default=3, ge=0)
-    max_tokens_per_batch: int = Field(default=6000, gt=0)
-    concurrent_requests: int = Field(default=1, ge=1)
+    max_tokens_per_batch: int = Field(default=6000, gt=0)  # Estimated prompt + response, without system prompt
+    token_packing: bool = True  # Size batches by max_tokens_per_batch instead of a fixed `size`
+    max_entries_per_batch: int = Field(default=40, gt=0, le=200)  # Upper bound for token-packed batches
+    concurrent_requests: int = Field(default=1, ge=1)  # Ceiling when adaptive_concurrency is on
+    adaptive_concurrency: bool = True  # Grow/shrink parallel requests on latency and rate limits
+    min_concurrent_requests: int = Field(default=1, ge=1)
     delay_between_batches: float = Field(default=2.0, ge=0.0)
+    isolate_failures: bool = True  # Bisect failed batches to find and quarantine the failing texts
+
+
+class MemoryConfig(BaseModel):
+    """Translation memory: reuse of earlier accepted translations."""
+
+    enabled: bool = True
+    file: str = "translation_memory.db"  # Relative to paths.work_dir
+    fuzzy_threshold: float = Field(default=0.7, ge=0.0, le=1.0)  # Min similarity for reference examples
+    max_references: int = Field(default=3, ge=0)  # Similar translations attached per batch
 
 
 class ProgressConfig(BaseModel):
@@ -135,7 +202,10 @@ class AppConfig(BaseModel):
     paths: PathsConfig
     languages: LanguagesConfig = Field(default_factory=LanguagesConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    extraction: ExtractionConfig = Field(default_factory=ExtractionConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
     batch: BatchConfig = Field(default_factory=BatchConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
     progress: ProgressConfig = Field(default_factory=ProgressConfig)
     filtering: FilteringConfig = Field(default_factory=FilteringConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -152,6 +222,10 @@ class AppConfig(BaseModel):
         """Get path to translated CSV."""
         return self.paths.translated_dir / f"{self.languages.target}.csv"
 
+    def get_memory_file(self) -> Path:
+        """Get path to the translation memory database."""
+        return self.paths.work_dir / self.memory.file
+
 
 class EnvConfig(BaseSettings):
     """Environment variables for API keys, model, and pricing."""
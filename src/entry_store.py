@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import unicodedata
+from collections.abc import Iterable, Iterator
+
+from .models import TranslationEntry, TranslationStatus
+
+
+class EntryStore:
+    """Translation entries in table order, indexed by id, position and status.
+
+    Status changes must go through the ``mark_*`` methods so the per-status indexes stay
+    in sync; context windows and status selections then cost O(window), not O(N).
+    """
+
+    __slots__ = ("_by_status", "_entries", "_positions")
+
+    def __init__(self, entries: Iterable[TranslationEntry] = ()):
+        self._entries = list(entries)
+        self._positions = {entry.id: pos for pos, entry in enumerate(self._entries)}
+        self._by_status: dict[TranslationStatus, set[int]] = {status: set() for status in TranslationStatus}
+        for pos, entry in enumerate(self._entries):
+            self._by_status[entry.status].add(pos)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[TranslationEntry]:
+        return iter(self._entries)
+
+    def __getitem__(self, pos: int) -> TranslationEntry:
+        return self._entries[pos]
+
+    def position(self, entry_id: str) -> int | None:
+        return self._positions.get(entry_id)
+
+    def get(self, entry_id: str) -> TranslationEntry | None:
+        pos = self._positions.get(entry_id)
+        return None if pos is None else self._entries[pos]
+
+    def count(self, status: TranslationStatus) -> int:
+        return len(self._by_status[status])
+
+    def with_status(self, status: TranslationStatus) -> list[TranslationEntry]:
+        """Entries with ``status``, in table order."""
+        return [self._entries[pos] for pos in sorted(self._by_status[status])]
+
+    def before(self, entry_id: str, count: int) -> list[TranslationEntry]:
+        """Up to ``count`` entries directly preceding ``entry_id``."""
+        pos = self._positions.get(entry_id)
+        if pos is None or count <= 0:
+            return []
+        return self._entries[max(0, pos - count) : pos]
+
+    def after(self, entry_id: str, count: int) -> list[TranslationEntry]:
+        """Up to ``count`` entries directly following ``entry_id``."""
+        pos = self._positions.get(entry_id)
+        if pos is None or count <= 0:
+            return []
+        return self._entries[pos + 1 : pos + 1 + count]
+
+    # Status changes
+
+    def _move(self, entry: TranslationEntry, old: TranslationStatus) -> None:
+        if entry.status is old:
+            return
+        pos = self._positions[entry.id]
+        self._by_status[old].discard(pos)
+        self._by_status[entry.status].add(pos)
+
+    def mark_translated(self, entry: TranslationEntry, translation: str) -> None:
+        old = entry.status
+        entry.mark_translated(translation)
+        self._move(entry, old)
+
+    def mark_skipped(self, entry: TranslationEntry) -> None:
+        old = entry.status
+        entry.mark_skipped()
+        self._move(entry, old)
+
+    def mark_error(self, entry: TranslationEntry, message: str) -> None:
+        old = entry.status
+        entry.mark_error(message)
+        self._move(entry, old)
+
+    def mark_for_retry(self, entry: TranslationEntry) -> None:
+        old = entry.status
+        entry.mark_for_retry()
+        self._move(entry, old)
+
+
+def group_duplicates(
+    entries: Iterable[TranslationEntry],
+) -> tuple[list[TranslationEntry], dict[str, list[TranslationEntry]]]:
+    """Collapse entries with the same (english, original) text.
+
+    Returns the first entry of each group, in order, and the remaining copies keyed by
+    that representative's id. Texts are compared after NFC normalization only, so
+    whitespace and punctuation differences still get their own translation.
+    """
+    representatives: dict[tuple[str, str], TranslationEntry] = {}
+    copies: dict[str, list[TranslationEntry]] = {}
+    for entry in entries:
+        key = (unicodedata.normalize("NFC", entry.english), unicodedata.normalize("NFC", entry.original))
+        if (first := representatives.get(key)) is None:
+            representatives[key] = entry
+        else:
+            copies.setdefault(first.id, []).append(entry)
+    return list(representatives.values()), copies
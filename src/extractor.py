@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import csv
+import hashlib
+import json
 import logging
+import mmap
 import struct
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Self
+from typing import Self, TypeVar
 
 import pyzstd
 
 from .models import ExtractionResult, TextEntry
+from .string_store import TableWriter, open_table, table_exists
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +26,31 @@ LogCallback = Callable[[str], None]
 ARCHIVE_MAGIC = b"\xef\xbe\xad\xde"  # 0xDEADBEEF
 TEXT_MAGIC = b"\xdc\x96\x58\x59"
 
+_TEXT_ENTRY = struct.Struct("<8sII")  # ID(8) + RelativeOffset(4) + Length(4)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _ordered_map(func: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """Map func over items on a thread pool, yielding results in input order.
+
+    At most ``workers * 2`` items are in flight, so memory stays bounded by a few
+    blocks. zstd and file I/O release the GIL, which is what makes threads pay off.
+    """
+    if workers <= 1:
+        yield from map(func, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 
 @dataclass(slots=True, frozen=True)
 class ArchiveHeader:
@@ -28,12 +59,11 @@ class ArchiveHeader:
     offset_count: int = 0
 
     @classmethod
-    def read(cls, data: bytes) -> Self | None:
+    def read(cls, data: bytes | memoryview) -> Self | None:
         if len(data) < 12 or data[:4] != ARCHIVE_MAGIC:
             return None
-        version = struct.unpack("<I", data[4:8])[0]
-        offset_count = struct.unpack("<I", data[8:12])[0] + 1
-        return cls(version=version, offset_count=offset_count)
+        version, block_count = struct.unpack_from("<II", data, 4)
+        return cls(version=version, offset_count=block_count + 1)
 
 
 @dataclass(slots=True)
@@ -44,10 +74,10 @@ class BlockHeader:
     decompressed_size: int
 
     @classmethod
-    def read(cls, data: bytes) -> Self | None:
+    def read(cls, data: bytes | memoryview) -> Self | None:
         if len(data) < 9:
             return None
-        comp_type, comp_size, decomp_size = struct.unpack("<BII", data[:9])
+        comp_type, comp_size, decomp_size = struct.unpack_from("<BII", data)
         return cls(compression_type=comp_type, compressed_size=comp_size, decompressed_size=decomp_size)
 
     @property
@@ -55,33 +85,216 @@ class BlockHeader:
         return self.compression_type == 0x04
 
 
+class ArchiveReader:
+    """Memory-mapped archive reader.
+
+    The offset table is parsed with a single ``unpack_from`` and blocks are handed out
+    as ``memoryview`` slices of the mapping, so nothing is copied until zstd reads it.
+    Callers must release block views (``with reader.block(i) as view``) before close.
+    """
+
+    __slots__ = ("_digest", "_file", "_mmap", "_view", "data_start", "header", "offsets")
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._mmap: mmap.mmap | None = None
+        self._view = memoryview(b"")
+        self.header: ArchiveHeader | None = None
+        self.offsets: tuple[int, ...] = ()
+        self.data_start = 0
+        self._digest = ""
+
+        try:
+            if path.stat().st_size >= 12:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mmap)
+            self._parse()
+        except BaseException:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        self.header = ArchiveHeader.read(self._view)
+        if self.header is None:
+            return
+
+        if self.header.offset_count == 1:
+            # Single block: CompBlockLen(4) + block
+            self.offsets = (0, struct.unpack_from("<I", self._view, 12)[0])
+            self.data_start = 16
+        else:
+            count = self.header.offset_count
+            self.offsets = struct.unpack_from(f"<{count}I", self._view, 12)
+            self.data_start = 12 + count * 4
+
+    @property
+    def block_count(self) -> int:
+        return max(0, len(self.offsets) - 1)
+
+    @property
+    def digest(self) -> str:
+        """md5 of the whole archive file (computed once)."""
+        if not self._digest:
+            self._digest = _file_digest(self._view)
+        return self._digest
+
+    def block(self, index: int) -> memoryview:
+        """Compressed block ``index`` (9-byte header + payload) as a zero-copy view."""
+        start = self.data_start + self.offsets[index]
+        end = self.data_start + self.offsets[index + 1]
+        return self._view[start:end]
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A block view escaped; the mapping is freed once it is collected
+                logger.debug("Archive mapping still referenced, deferring close")
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+@dataclass(slots=True, frozen=True)
+class BlockRecord:
+    """Manifest record of one extracted block: where it was and what it contained."""
+    offset: int
+    size: int
+    digest: str  # md5 of the compressed block
+    decompressed_size: int
+
+
+class ExtractionManifest:
+    """Content-addressed record of the last extraction into a .dat directory.
+
+    Stored as ``.extract_manifest.json`` next to the .dat files. Blocks whose compressed
+    bytes hash the same as last time (and whose .dat is still intact) are not
+    decompressed again; the CSV is rebuilt only when the archive digest changed.
+    """
+
+    FILE_NAME = ".extract_manifest.json"
+    VERSION = 1
+
+    __slots__ = ("_dirty", "archive_digest", "blocks", "csv_digest", "csv_texts", "path")
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.archive_digest = ""
+        self.blocks: list[BlockRecord] = []
+        self.csv_digest = ""  # Archive digest the CSV was last built from
+        self.csv_texts = 0
+        self._dirty = False
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != self.VERSION:
+                return
+            self.archive_digest = data["archive"]
+            self.blocks = [BlockRecord(*record) for record in data["blocks"]]
+            self.csv_digest = data.get("csv", "")
+            self.csv_texts = data.get("csv_texts", 0)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extraction manifest {self.path}: {e}")
+            self.blocks = []
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "version": self.VERSION,
+            "archive": self.archive_digest,
+            "csv": self.csv_digest,
+            "csv_texts": self.csv_texts,
+            "blocks": [
+                [record.offset, record.size, record.digest, record.decompressed_size]
+                for record in self.blocks
+            ],
+        }
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        temp.replace(self.path)
+        self._dirty = False
+
+    def unchanged(self, index: int, record: BlockRecord, output_path: Path) -> bool:
+        """True if block ``index`` has the same content as last run and its .dat is intact."""
+        if index >= len(self.blocks):
+            return False
+        previous = self.blocks[index]
+        if (previous.size, previous.digest) != (record.size, record.digest):
+            return False
+        return _has_size(output_path, previous.decompressed_size)
+
+    def is_current(self, archive_digest: str, csv_file: Path, dat_dir: Path | None, base_name: str) -> bool:
+        """True if the CSV (and the .dat files, when ``dat_dir`` is given) match this archive."""
+        if not archive_digest or archive_digest != self.archive_digest or self.csv_digest != archive_digest:
+            return False
+        if not table_exists(csv_file):
+            return False
+        if dat_dir is None:
+            return True
+        return bool(self.blocks) and all(
+            _has_size(dat_dir / f"{base_name}_{i}.dat", record.decompressed_size)
+            for i, record in enumerate(self.blocks)
+            if record.digest
+        )
+
+    def update(self, archive_digest: str, blocks: list[BlockRecord]) -> None:
+        self.archive_digest = archive_digest
+        self.blocks = blocks
+        self._dirty = True
+
+    def set_csv(self, texts: int) -> None:
+        self.csv_digest = self.archive_digest
+        self.csv_texts = texts
+        self._dirty = True
+
+
+def _file_digest(view: memoryview) -> str:
+    return hashlib.md5(view).hexdigest()
+
+
+def _has_size(path: Path, size: int) -> bool:
+    try:
+        return path.stat().st_size == size
+    except OSError:
+        return False
+
+
 class BinaryExtractor:
-    """Game archive extractor (ZSTD compressed blocks)."""
+    """Game archive extractor (ZSTD compressed blocks).
+
+    ``workers > 1`` decompresses blocks and writes ``.dat`` files on a thread pool;
+    results, logs and errors are still reported in block order.
+    """
 
-    __slots__ = ("_log",)
+    __slots__ = ("_log", "_workers")
 
-    def __init__(self, log_callback: LogCallback | None = None):
+    def __init__(self, log_callback: LogCallback | None = None, workers: int = 1):
         self._log = log_callback or logger.info
+        self._workers = max(1, workers)
 
     def extract(self, input_file: Path, output_dir: Path) -> ExtractionResult:
         errors: list[str] = []
-        files_count = 0
 
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
             base_name = input_file.stem
 
-            with open(input_file, "rb") as f:
-                header_data = f.read(12)
-                header = ArchiveHeader.read(header_data)
-
-                if header is None:
+            with ArchiveReader(input_file) as reader:
+                if reader.header is None:
                     return ExtractionResult.fail(f"Invalid archive: {input_file}")
 
-                if header.offset_count == 1:
-                    files_count = self._extract_single(f, output_dir, base_name)
-                else:
-                    files_count, errors = self._extract_multiple(f, output_dir, base_name, header.offset_count)
+                files_count, errors = self._extract_blocks(reader, output_dir, base_name)
 
             return ExtractionResult.ok(f"Extracted {files_count} files", files=files_count)
 
@@ -89,49 +302,138 @@ class BinaryExtractor:
             logger.exception("Archive extraction failed")
             return ExtractionResult.fail(str(e), errors)
 
-    def _extract_single(self, f, output_dir: Path, base_name: str) -> int:
-        comp_block_len = struct.unpack("<I", f.read(4))[0]
-        comp_block = f.read(comp_block_len)
-
-        block_header = BlockHeader.read(comp_block[:9])
-        if block_header is None or not block_header.is_zstd:
-            return 0
-
-        decomp_data = pyzstd.decompress(comp_block[9:])
-        output_path = output_dir / f"{base_name}_0.dat"
-        output_path.write_bytes(decomp_data)
-
-        self._log(f"Extracted: {output_path.name}")
-        return 1
-
-    def _extract_multiple(self, f, output_dir: Path, base_name: str, offset_count: int) -> tuple[int, list[str]]:
+    def iter_blocks(
+        self,
+        reader: ArchiveReader,
+        base_name: str,
+        output_dir: Path | None = None,
+        manifest: ExtractionManifest | None = None,
+    ) -> Iterator[tuple[str, bytes]]:
+        """Decompress blocks, yielding ``(dat_name, data)`` in .dat file name order.
+
+        That is the order ``TextExtractor`` reads a directory in, so the CSV comes out the
+        same either way. With ``output_dir`` each block is also written there; blocks the
+        manifest knows to be intact on disk are read back from their .dat file instead of
+        being decompressed and rewritten. Failed blocks are logged and skipped. The
+        manifest is updated and saved once the iteration is exhausted.
+        """
+        names = [f"{base_name}_{i}.dat" for i in range(reader.block_count)]
+        order = sorted(range(len(names)), key=names.__getitem__)
+        # Placeholder records have an empty digest, which never matches on the next run
+        records = [BlockRecord(offset, 0, "", -1) for offset in reader.offsets[:-1]]
         errors: list[str] = []
-        count = 0
-
-        offsets = [struct.unpack("<I", f.read(4))[0] for _ in range(offset_count)]
-        data_start = f.tell()
 
-        for i in range(offset_count - 1):
-            block_len = offsets[i + 1] - offsets[i]
-            f.seek(data_start + offsets[i])
-            comp_block = f.read(block_len)
-
-            block_header = BlockHeader.read(comp_block[:9])
-            if block_header is None or not block_header.is_zstd:
+        def extract_block(i: int) -> tuple[bytes | None, bool, str | None]:
+            with reader.block(i) as comp_block:
+                block_header = BlockHeader.read(comp_block)
+                if block_header is None or not block_header.is_zstd:
+                    return None, False, None
+
+                record = BlockRecord(
+                    offset=reader.offsets[i],
+                    size=len(comp_block),
+                    digest=_file_digest(comp_block),
+                    decompressed_size=block_header.decompressed_size,
+                )
+                output_path = output_dir / names[i] if output_dir is not None else None
+                if (
+                    output_path is not None
+                    and manifest is not None
+                    and manifest.unchanged(i, record, output_path)
+                ):
+                    try:
+                        data = output_path.read_bytes()
+                    except OSError:
+                        pass  # Vanished since the check: decompress it again
+                    else:
+                        records[i] = BlockRecord(record.offset, record.size, record.digest, len(data))
+                        return data, False, None
+
+                try:
+                    decomp_data = pyzstd.decompress(comp_block[9:])
+                    if output_path is not None:
+                        output_path.write_bytes(decomp_data)
+                except Exception as e:
+                    return None, False, f"Block {i}: {e}"
+
+                records[i] = BlockRecord(record.offset, record.size, record.digest, len(decomp_data))
+                return decomp_data, output_path is not None, None
+
+        for i, (data, written, error) in zip(order, _ordered_map(extract_block, order, self._workers)):
+            if error:
+                errors.append(error)
+                logger.warning(f"Extraction error: {error}")
                 continue
+            if written:
+                self._log(f"Extracted: {names[i]}")
+            if data is not None:
+                yield names[i], data
+
+        if manifest is not None:
+            if output_dir is not None:
+                self._remove_stale(output_dir, base_name, reader.block_count)
+            # Block records only describe .dat files on disk; a failed block must be
+            # retried next run, so the archive digest is not recorded either
+            manifest.update(
+                reader.digest if not errors else "",
+                records if output_dir is not None else [],
+            )
+            manifest.save()
+
+    def _remove_stale(self, output_dir: Path, base_name: str, block_count: int) -> int:
+        """Delete .dat files left over from blocks beyond the current archive's count."""
+        removed = 0
+        prefix = f"{base_name}_"
+        for dat_file in output_dir.glob(f"{prefix}*.dat"):
+            index = dat_file.stem[len(prefix):]
+            if index.isdigit() and int(index) >= block_count:
+                dat_file.unlink()
+                removed += 1
+                self._log(f"Removed: {dat_file.name}")
+        return removed
+
+    def _extract_blocks(
+        self, reader: ArchiveReader, output_dir: Path, base_name: str
+    ) -> tuple[int, list[str]]:
+        errors: list[str] = []
+        count = 0
 
-            try:
-                decomp_data = pyzstd.decompress(comp_block[9:])
-                output_path = output_dir / f"{base_name}_{i}.dat"
-                output_path.write_bytes(decomp_data)
+        def extract_block(i: int) -> tuple[Path | None, str | None]:
+            with reader.block(i) as comp_block:
+                block_header = BlockHeader.read(comp_block)
+                if block_header is None or not block_header.is_zstd:
+                    return None, None
+
+                try:
+                    decomp_data = pyzstd.decompress(comp_block[9:])
+                    output_path = output_dir / f"{base_name}_{i}.dat"
+                    output_path.write_bytes(decomp_data)
+                    return output_path, None
+                except Exception as e:
+                    return None, f"Block {i}: {e}"
+
+        blocks = range(reader.block_count)
+        for output_path, error in _ordered_map(extract_block, blocks, self._workers):
+            if error:
+                errors.append(error)
+            elif output_path is not None:
                 count += 1
                 self._log(f"Extracted: {output_path.name}")
-            except Exception as e:
-                errors.append(f"Block {i}: {e}")
 
         return count, errors
 
-    def pack(self, input_dir: Path, output_file: Path) -> ExtractionResult:
+    def pack(
+        self,
+        input_dir: Path,
+        output_file: Path,
+        base_archive: Path | None = None,
+    ) -> ExtractionResult:
+        """Pack .dat files into an archive.
+
+        With ``base_archive`` (the archive the .dat files were extracted from), blocks whose
+        content is unchanged are copied compressed from it and only modified ones are
+        recompressed.
+        """
         import re
 
         try:
@@ -145,69 +447,157 @@ class BinaryExtractor:
 
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_file, "wb") as outfile:
-                self._write_archive(outfile, dat_files)
-            return ExtractionResult.ok(f"Packed {len(dat_files)} files", files=len(dat_files))
+            if base_archive is not None and (
+                not base_archive.exists() or base_archive.resolve() == output_file.resolve()
+            ):
+                base_archive = None
+
+            if base_archive is None:
+                with open(output_file, "wb") as outfile:
+                    reused = self._write_archive(outfile, dat_files)
+            else:
+                with ArchiveReader(base_archive) as base, open(output_file, "wb") as outfile:
+                    reused = self._write_archive(outfile, dat_files, base if base.header else None)
+
+            message = f"Packed {len(dat_files)} files"
+            if reused:
+                message += f" ({reused} blocks reused)"
+            return ExtractionResult.ok(message, files=len(dat_files))
 
         except Exception as e:
             logger.exception("Packing failed")
             return ExtractionResult.fail(str(e))
 
-    def _write_archive(self, outfile, dat_files: list[Path]) -> None:
-        """Write archive header, offsets and compressed blocks."""
+    def _write_archive(
+        self,
+        outfile,
+        dat_files: list[Path],
+        base: ArchiveReader | None = None,
+    ) -> int:
+        """Write archive header, then stream compressed blocks and patch the offset table.
+
+        Blocks are written as soon as they are compressed (in order), so memory is bounded
+        by the worker window instead of the whole archive. Returns the number of blocks
+        copied unchanged from ``base``.
+        """
         outfile.write(ARCHIVE_MAGIC)
         outfile.write(b"\x01\x00\x00\x00")
         outfile.write(struct.pack("<I", len(dat_files)))
 
-        archive_data = b""
+        table_pos = outfile.tell()
+        outfile.write(bytes(4 * (len(dat_files) + 1)))
 
-        for dat_file in dat_files:
+        def compress_file(item: tuple[int, Path]) -> tuple[bytes | memoryview, ...]:
+            index, dat_file = item
             file_data = dat_file.read_bytes()
+
+            if base is not None and (block := self._matching_block(base, index, file_data)):
+                return (block,)
+
             comp_data = pyzstd.compress(file_data)
+            return struct.pack("<BII", 4, len(comp_data), len(file_data)), comp_data
+
+        offsets: list[int] = []
+        position = 0
+        reused = 0
+        blocks = _ordered_map(compress_file, enumerate(dat_files), self._workers)
+
+        for dat_file, parts in zip(dat_files, blocks):
+            offsets.append(position)
+            for part in parts:
+                outfile.write(part)
+                position += len(part)
+
+            if isinstance(parts[0], memoryview):
+                parts[0].release()
+                reused += 1
+                self._log(f"Reused: {dat_file.name}")
+            else:
+                self._log(f"Packed: {dat_file.name}")
+
+        offsets.append(position)
+
+        end_pos = outfile.tell()
+        outfile.seek(table_pos)
+        outfile.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        outfile.seek(end_pos)
+
+        return reused
+
+    @staticmethod
+    def _matching_block(base: ArchiveReader, index: int, file_data: bytes) -> memoryview | None:
+        """Return base block ``index`` if it decompresses to exactly ``file_data``.
+
+        Verifying costs one decompression, which is far cheaper than recompressing and
+        keeps the reuse safe even if the base archive is not the one the data came from.
+        """
+        if index >= base.block_count:
+            return None
 
-            header = struct.pack("<BII", 4, len(comp_data), len(file_data))
-            outfile.write(struct.pack("<I", len(archive_data)))
-            archive_data += header + comp_data
+        block = base.block(index)
+        header = BlockHeader.read(block)
 
-            self._log(f"Packed: {dat_file.name}")
+        if header is not None and header.is_zstd and header.decompressed_size == len(file_data):
+            try:
+                if pyzstd.decompress(block[9:]) == file_data:
+                    return block
+            except pyzstd.ZstdError:
+                pass
 
-        outfile.write(struct.pack("<I", len(archive_data)))
-        outfile.write(archive_data)
+        block.release()
+        return None
 
 
 class TextExtractor:
     """Text extractor from .dat files (legacy format with TEXT_MAGIC)."""
 
-    __slots__ = ("_log",)
+    __slots__ = ("_csv_output", "_log")
 
-    def __init__(self, log_callback: LogCallback | None = None):
+    def __init__(self, log_callback: LogCallback | None = None, csv_output: bool = True):
         self._log = log_callback or logger.info
+        self._csv_output = csv_output  # False: write only the string store
 
     def extract(self, input_dir: Path, output_file: Path) -> ExtractionResult:
+        dat_files = sorted(input_dir.glob("*.dat"))
+        if not dat_files:
+            return ExtractionResult.fail("No .dat files found")
+
+        return self._write_csv(
+            output_file,
+            ((dat_file.name, partial(self._extract_from_dat, dat_file)) for dat_file in dat_files),
+        )
+
+    def extract_blocks(self, blocks: Iterable[tuple[str, bytes]], output_file: Path) -> ExtractionResult:
+        """Write the CSV straight from decompressed .dat contents, given as ``(name, data)``."""
+        return self._write_csv(
+            output_file,
+            ((name, partial(self._extract_from_buffer, data, name)) for name, data in blocks),
+        )
+
+    def _write_csv(
+        self,
+        output_file: Path,
+        sources: Iterable[tuple[str, Callable[[int], Iterator[TextEntry]]]],
+    ) -> ExtractionResult:
         try:
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            dat_files = sorted(input_dir.glob("*.dat"))
-            if not dat_files:
-                return ExtractionResult.fail("No .dat files found")
-
             total_texts = 0
+            files_count = 0
 
-            with open(output_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=";")
-                writer.writerow(TextEntry.csv_header())
-
-                for dat_file in dat_files:
-                    entries = list(self._extract_from_dat(dat_file, total_texts))
+            with TableWriter(output_file, TextEntry.csv_header(), csv_file=self._csv_output) as writer:
+                for name, parse in sources:
+                    entries = list(parse(total_texts))
+                    files_count += 1
 
                     for entry in entries:
                         writer.writerow(entry.to_csv_row())
                         total_texts += 1
 
                     if entries:
-                        self._log(f"Processed: {dat_file.name} ({len(entries)} rows)")
+                        self._log(f"Processed: {name} ({len(entries)} rows)")
 
-            return ExtractionResult.ok(f"Extracted {total_texts} texts", texts=total_texts)
+            return ExtractionResult.ok(f"Extracted {total_texts} texts", files=files_count, texts=total_texts)
 
         except Exception as e:
             logger.exception("Text extraction failed")
@@ -215,60 +605,74 @@ class TextExtractor:
 
     def _extract_from_dat(self, dat_file: Path, start_number: int) -> Iterator[TextEntry]:
         try:
-            with open(dat_file, "rb") as f:
-                f.seek(16)
-                if f.read(4) != TEXT_MAGIC:
-                    return
-
-                f.seek(0)
-                count_full = struct.unpack("<I", f.read(4))[0]
-                f.read(4)
-                count_text = struct.unpack("<I", f.read(4))[0]
-                f.read(12)
-
-                code = f.read(count_full).hex()
-                f.read(17)
-                data_start = f.tell()
-
-                for i in range(count_full):
-                    f.seek(data_start + (i * 16))
-                    text_id = f.read(8).hex()
-                    start_text_offset = f.tell()
-                    offset_text = struct.unpack("<I", f.read(4))[0]
-                    length = struct.unpack("<I", f.read(4))[0]
-
-                    f.seek(start_text_offset + offset_text)
-                    text = f.read(length).decode("utf-8", errors="ignore")
-                    text = text.replace("\n", "\\n").replace("\r", "\\r")
-
-                    yield TextEntry(
-                        number=start_number + i + 1,
-                        file_name=dat_file.name,
-                        all_blocks=count_full,
-                        work_blocks=count_text,
-                        current_block=i,
-                        unknown=code[i * 2 : (i + 1) * 2],
-                        text_id=text_id,
-                        original_text=text,
-                    )
+            if dat_file.stat().st_size < 20:
+                return
+
+            with (
+                open(dat_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                yield from self._parse_entries(view, dat_file.name, start_number)
 
         except Exception as e:
             logger.warning(f"Error reading {dat_file}: {e}")
 
+    def _extract_from_buffer(self, data: bytes, file_name: str, start_number: int) -> Iterator[TextEntry]:
+        try:
+            if len(data) < 20:
+                return
+
+            with memoryview(data) as view:
+                yield from self._parse_entries(view, file_name, start_number)
+
+        except Exception as e:
+            logger.warning(f"Error reading {file_name}: {e}")
+
+    @staticmethod
+    def _parse_entries(data: memoryview, file_name: str, start_number: int) -> Iterator[TextEntry]:
+        """Parse text entries straight from a buffer, decoding only the text slices."""
+        if data[16:20] != TEXT_MAGIC:
+            return
+
+        count_full = struct.unpack_from("<I", data, 0)[0]
+        count_text = struct.unpack_from("<I", data, 8)[0]
+
+        code = data[24 : 24 + count_full].hex()
+        data_start = (24 + count_full + 17 + 7) & ~7  # Control bytes are padded to 8
+
+        for i in range(count_full):
+            entry_offset = data_start + i * 16
+            raw_id, offset_text, length = _TEXT_ENTRY.unpack_from(data, entry_offset)
+
+            text_start = entry_offset + 8 + offset_text
+            text = str(data[text_start : text_start + length], "utf-8", "ignore")
+            text = text.replace("\n", "\\n").replace("\r", "\\r")
+
+            yield TextEntry(
+                number=start_number + i + 1,
+                file_name=file_name,
+                all_blocks=count_full,
+                work_blocks=count_text,
+                current_block=i,
+                unknown=code[i * 2 : (i + 1) * 2],
+                text_id=raw_id.hex(),
+                original_text=text,
+            )
+
     def pack(self, csv_file: Path, output_dir: Path) -> ExtractionResult:
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
 
             entries_by_file: dict[str, list[TextEntry]] = {}
 
-            with open(csv_file, encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=";")
-                next(reader)
+            table = open_table(csv_file)
+            if table is None:
+                return ExtractionResult.fail(f"Table not found: {csv_file}")
 
-                for row in reader:
-                    if len(row) < 8:
-                        continue
-                    entry = TextEntry.from_csv_row(row)
+            with table:
+                for row in table.iter_rows(*TextEntry.csv_header()):
+                    entry = TextEntry.from_csv_row(list(row))
                     entries_by_file.setdefault(entry.file_name, []).append(entry)
 
             files_count = 0
@@ -297,8 +701,10 @@ class TextExtractor:
         file_bytes = TEXT_MAGIC + b"\x00\x00\x00\x00"
 
         start_unk = len(all_blocks_bytes) + len(work_blocks_bytes) + len(file_bytes)
-        start_id = start_unk + all_blocks + 17
+        # Control bytes are padded to 8, where _parse_entries looks for the entry table
+        start_id = (start_unk + all_blocks + 17 + 7) & ~7
         curr_text = start_id + all_blocks * 16
+        control_size = start_id - start_unk
 
         filled_bytes_unk = b""
         filled_bytes_id = b""
@@ -329,6 +735,8 @@ class TextExtractor:
             filled_bytes_text += text_encoded
             curr_text += len(text_encoded)
 
+        filled_bytes_unk += b"\x80" * (control_size - len(filled_bytes_unk))
+
         with open(output_path, "wb") as f:
             f.write(all_blocks_bytes)
             f.write(work_blocks_bytes)
@@ -342,26 +750,62 @@ def extract_game_locale(
     locale_file: Path,
     output_base_dir: Path,
     log_callback: LogCallback | None = None,
+    *,
+    workers: int = 1,
+    force: bool = False,
+    write_dat: bool = True,
+    csv_output: bool = True,
 ) -> ExtractionResult:
-    """Full extraction pipeline: archive -> .dat files -> CSV."""
+    """Full extraction pipeline: archive -> CSV (and .dat files if ``write_dat``).
+
+    Decompressed blocks go straight into the text parser; .dat files are only needed
+    as the patch base for autopatch. The run is incremental: unchanged .dat files are
+    not rewritten and nothing is done when the archive matches the last run.
+    ``force`` ignores the extraction manifest. The texts always go to the string store;
+    ``csv_output=False`` skips the CSV copy.
+    """
     lang_code = locale_file.name.replace("translate_words_map_", "")
     dat_dir = output_base_dir / "dat" / lang_code
     csv_file = output_base_dir / "csv" / f"{lang_code}.csv"
+    base_name = locale_file.stem
+
+    dat_dir.mkdir(parents=True, exist_ok=True)  # Also holds the manifest
+    manifest = ExtractionManifest(dat_dir / ExtractionManifest.FILE_NAME)
+    if not force:
+        manifest.load()
+
+    binary_extractor = BinaryExtractor(log_callback, workers=workers)
+    text_extractor = TextExtractor(log_callback, csv_output=csv_output)
+
+    try:
+        with ArchiveReader(locale_file) as reader:
+            if reader.header is None:
+                return ExtractionResult.fail(f"Invalid archive: {locale_file}")
+
+            if manifest.is_current(reader.digest, csv_file, dat_dir if write_dat else None, base_name):
+                return ExtractionResult.ok(
+                    f"Up to date: {reader.block_count} files, {manifest.csv_texts} texts",
+                    files=reader.block_count,
+                    texts=manifest.csv_texts,
+                )
+
+            blocks = binary_extractor.iter_blocks(
+                reader, base_name, dat_dir if write_dat else None, manifest
+            )
+            text_result = text_extractor.extract_blocks(blocks, csv_file)
 
-    binary_extractor = BinaryExtractor(log_callback)
-    archive_result = binary_extractor.extract(locale_file, dat_dir)
-
-    if not archive_result.success:
-        return archive_result
-
-    text_extractor = TextExtractor(log_callback)
-    text_result = text_extractor.extract(dat_dir, csv_file)
+    except Exception as e:
+        logger.exception("Archive extraction failed")
+        return ExtractionResult.fail(str(e))
 
     if not text_result.success:
         return text_result
 
+    manifest.set_csv(text_result.texts_extracted)
+    manifest.save()
+
     return ExtractionResult.ok(
-        f"Extracted {archive_result.files_extracted} files, {text_result.texts_extracted} texts",
-        files=archive_result.files_extracted,
+        f"Extracted {text_result.files_extracted} files, {text_result.texts_extracted} texts",
+        files=text_result.files_extracted,
         texts=text_result.texts_extracted,
     )
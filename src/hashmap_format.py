@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import struct
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Iterator
 
 from .models import TextEntry
 
 
+logger = logging.getLogger(__name__)
+
+_ENTRY = struct.Struct('<8sII')  # Hash(8) + RelativeOffset(4) + TextLength(4)
+
+
 @dataclass(slots=True)
 class HashMapHeader:
     """24-byte header: Int64 EntryCount, Int64 ValueCount, Int32 Timestamp, Int32 Padding."""
@@ -29,21 +38,153 @@ class HashMapHeader:
 
 @dataclass(slots=True)
 class TableEntry:
-    """Entry: 8-byte hash + Int32 RelativeOffset + Int32 TextLength."""
+    """Entry: 8-byte hash + Int32 RelativeOffset + Int32 TextLength.
+    
+    Text stays a slice of the file buffer and is only decoded when ``text`` is read.
+    """
     hash_id: bytes
     relative_offset: int
     text_length: int
-    text: str = ""
+    text_pos: int = -1  # Absolute text position in source, -1 if out of bounds
+    source: memoryview | None = field(default=None, repr=False)
+    modified: bool = False  # Set when text is assigned; write() re-encodes only these
+    _text: str | None = field(default=None, repr=False)
     
     @property
     def id_hex(self) -> str:
         return self.hash_id.hex()
+    
+    @property
+    def raw(self) -> bytes | memoryview:
+        """Encoded text as stored in the file (zero-copy view)."""
+        if self.text_pos < 0 or self.source is None:
+            return b''
+        return self.source[self.text_pos:self.text_pos + self.text_length]
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = str(self.raw, 'utf-8', errors='ignore')
+        return self._text
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self.modified = True
+
+
+# Tables written by older versions of this tool sit after a fixed-size bucket area
+LEGACY_BUCKET_COUNTS = (64, 128, 32, 256, 16)
+
+
+def _layout_candidates(entry_count: int) -> list[int]:
+    """Possible entry table offsets, most likely first.
+    
+    Game files store the table right after EntryCount + 17 control bytes (padded to 8).
+    """
+    control_end = (24 + entry_count + 17 + 7) & ~7
+    return [control_end, *(24 + count * 8 for count in LEGACY_BUCKET_COUNTS)]
+
+
+def _check_layout(data: bytes, entry_count: int, entries_start: int) -> bool | None:
+    """Validate a table offset: None if any text falls outside the text region,
+    otherwise whether texts are laid out back to back (the tie-breaker)."""
+    table_end = entries_start + entry_count * 16
+    if table_end > len(data):
+        return None
+    
+    expected = table_end
+    contiguous = True
+    entry_offset = entries_start
+    for _, relative_offset, text_length in _ENTRY.iter_unpack(memoryview(data)[entries_start:table_end]):
+        text_pos = entry_offset + 8 + relative_offset
+        if text_pos < table_end or text_pos + text_length > len(data):
+            return None
+        contiguous = contiguous and text_pos == expected
+        expected += text_length
+        entry_offset += 16
+    return contiguous
+
+
+def detect_layout(data: bytes, entry_count: int) -> tuple[int | None, str]:
+    """Find the entry table offset by validating every entry of each candidate.
+    
+    Returns (offset, "") or (None, reason) when no candidate or more than one fits.
+    """
+    results = {start: _check_layout(data, entry_count, start) for start in _layout_candidates(entry_count)}
+    valid = [start for start, contiguous in results.items() if contiguous is not None]
+    
+    if len(valid) == 1:
+        return valid[0], ""
+    if not valid:
+        return None, "unrecognized layout"
+    
+    contiguous = [start for start in valid if results[start]]
+    if len(contiguous) == 1:
+        return contiguous[0], ""
+    return None, f"ambiguous layout (offsets {', '.join(map(str, valid))})"
+
+
+class LayoutIndex:
+    """Sidecar index of detected table offsets, keyed by file name + content hash.
+    
+    Lets repeated runs skip probing; unrecognized files are cached as well (offset None).
+    """
+    
+    FILE_NAME = ".layout_index.json"
+    VERSION = 1
+    
+    __slots__ = ('_dirty', '_files', 'path')
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._files: dict[str, tuple[str, int | None]] = {}
+        self._dirty = False
+    
+    @classmethod
+    def for_dir(cls, directory: Path) -> LayoutIndex:
+        """Load (or start) the index stored next to the .dat files."""
+        index = cls(Path(directory) / cls.FILE_NAME)
+        index.load()
+        return index
+    
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == self.VERSION:
+                self._files = {name: (digest, start) for name, (digest, start) in data['files'].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable layout index {self.path}: {e}")
+    
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {'version': self.VERSION, 'files': self._files}
+        temp = self.path.with_suffix('.tmp')
+        temp.write_text(json.dumps(payload, separators=(',', ':')), encoding='utf-8')
+        temp.replace(self.path)
+        self._dirty = False
+    
+    def resolve(self, name: str, data: bytes, entry_count: int) -> tuple[int | None, str]:
+        """Cached offset for this exact content, detecting and recording it on a miss."""
+        digest = hashlib.md5(data).hexdigest()
+        cached = self._files.get(name)
+        if cached is not None and cached[0] == digest:
+            start = cached[1]
+            return start, "" if start is not None else "unrecognized layout (cached)"
+        
+        start, error = detect_layout(data, entry_count)
+        self._files[name] = (digest, start)
+        self._dirty = True
+        return start, error
 
 
 class HashMapDatFile:
     """Parser/Writer for HashMap .dat files. Preserves bucket structure."""
     
-    __slots__ = ('header', 'buckets', 'entries', 'raw_data', 'bucket_end_offset')
+    __slots__ = ('header', 'buckets', 'entries', 'raw_data', 'bucket_end_offset', 'layout_error')
     
     def __init__(self):
         self.header: HashMapHeader | None = None
@@ -51,8 +192,13 @@ class HashMapDatFile:
         self.entries: list[TableEntry] = []
         self.raw_data: bytes = b''
         self.bucket_end_offset: int = 0
+        self.layout_error: str = ""
     
-    def read(self, data: bytes) -> bool:
+    def read(self, data: bytes, layout: LayoutIndex | None = None, name: str = "") -> bool:
+        """Parse data; returns False (with layout_error set) if the table can't be located.
+        
+        With a layout index, the table offset is looked up by name + content hash.
+        """
         if len(data) < 24:
             return False
         
@@ -64,60 +210,33 @@ class HashMapDatFile:
             self.buckets = data[24:]
             return True
         
-        # Detect bucket size
-        bucket_candidates = [64, 128, 32, 256, 16]
+        if layout is not None:
+            entries_start, self.layout_error = layout.resolve(name, data, entry_count)
+        else:
+            entries_start, self.layout_error = detect_layout(data, entry_count)
         
-        for bucket_count in bucket_candidates:
-            bucket_size = bucket_count * 8
-            entries_start = 24 + bucket_size
-            
-            if entries_start + entry_count * 16 > len(data):
-                continue
-            
-            valid = True
-            for i in range(min(3, entry_count)):
-                entry_offset = entries_start + i * 16
-                if entry_offset + 16 > len(data):
-                    valid = False
-                    break
-                    
-                pot_offset = struct.unpack('<I', data[entry_offset + 8:entry_offset + 12])[0]
-                pot_length = struct.unpack('<I', data[entry_offset + 12:entry_offset + 16])[0]
-                
-                text_pos = entry_offset + 8 + pot_offset
-                if text_pos < 0 or text_pos + pot_length > len(data):
-                    valid = False
-                    break
-            
-            if valid:
-                self.bucket_end_offset = entries_start
-                self.buckets = data[24:entries_start]
-                break
-        
-        if not self.buckets:
-            self.bucket_end_offset = 24 + 512
-            self.buckets = data[24:self.bucket_end_offset]
-        
-        entries_start = self.bucket_end_offset
-        self.entries = []
-        
-        for i in range(entry_count):
-            entry_offset = entries_start + i * 16
-            if entry_offset + 16 > len(data):
-                break
-                
-            hash_id = data[entry_offset:entry_offset + 8]
-            relative_offset = struct.unpack('<I', data[entry_offset + 8:entry_offset + 12])[0]
-            text_length = struct.unpack('<I', data[entry_offset + 12:entry_offset + 16])[0]
-            
+        if entries_start is None:
+            return False
+        
+        self.bucket_end_offset = entries_start
+        self.buckets = data[24:entries_start]
+        
+        table_end = entries_start + entry_count * 16
+        
+        view = memoryview(data)
+        entries: list[TableEntry] = []
+        append = entries.append
+        entry_offset = entries_start
+        
+        # Whole table in one pass; texts stay undecoded views into data
+        for hash_id, relative_offset, text_length in _ENTRY.iter_unpack(view[entries_start:table_end]):
             text_pos = entry_offset + 8 + relative_offset
-            
-            text = ""
-            if text_length > 0 and text_pos + text_length <= len(data):
-                text = data[text_pos:text_pos + text_length].decode('utf-8', errors='ignore')
-            
-            self.entries.append(TableEntry(hash_id, relative_offset, text_length, text))
+            if text_length == 0 or text_pos + text_length > len(data):
+                text_pos = -1
+            append(TableEntry(hash_id, relative_offset, text_length, text_pos, view))
+            entry_offset += 16
         
+        self.entries = entries
         return True
     
     def write(self, translations: dict[str, str] | None = None) -> bytes:
@@ -131,29 +250,26 @@ class HashMapDatFile:
                     entry.text = translations[entry.id_hex]
         
         entries_start = 24 + len(self.buckets)
+        table_size = len(self.entries) * 16
         
-        text_data = b''
-        text_positions: list[tuple[int, int]] = []
+        # Untouched entries reuse their original bytes; only edited texts are encoded
+        texts = [
+            entry.text.encode('utf-8') if entry.modified else entry.raw
+            for entry in self.entries
+        ]
         
-        for i, entry in enumerate(self.entries):
-            entry_offset = entries_start + i * 16
-            text_encoded = entry.text.encode('utf-8')
-            
-            text_pos = entries_start + len(self.entries) * 16 + len(text_data)
-            relative_offset = text_pos - (entry_offset + 8)
-            
-            text_positions.append((relative_offset, len(text_encoded)))
-            text_data += text_encoded
+        table = bytearray(table_size)
+        text_pos = entries_start + table_size
         
-        entries_data = b''
-        for i, entry in enumerate(self.entries):
-            rel_off, length = text_positions[i]
-            entries_data += entry.hash_id
-            entries_data += struct.pack('<II', rel_off, length)
+        for i, (entry, text) in enumerate(zip(self.entries, texts)):
+            entry_offset = i * 16
+            relative_offset = text_pos - (entries_start + entry_offset + 8)
+            _ENTRY.pack_into(table, entry_offset, entry.hash_id, relative_offset, len(text))
+            text_pos += len(text)
         
         self.header.value_count = len(self.entries)
         
-        return self.header.to_bytes() + self.buckets + entries_data + text_data
+        return b''.join((self.header.to_bytes(), self.buckets, table, *texts))
     
     def get_text_entries(self, file_name: str, start_number: int = 0) -> Iterator[TextEntry]:
         if not self.header:
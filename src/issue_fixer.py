@@ -13,8 +13,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .string_store import TableWriter, open_table
+
 if TYPE_CHECKING:
     from .llm_client import LLMClient
+    from .llm_pool import LLMPool
+    from .translation_memory import TranslationMemory
 
 
 logger = logging.getLogger(__name__)
@@ -367,7 +371,7 @@ IMPORTANT:
 
     def __init__(
         self,
-        llm_client: LLMClient,
+        llm_client: LLMClient | LLMPool,
         batch_size: int = 5,
         log_callback: Callable[[str], None] | None = None,
     ):
@@ -492,33 +496,44 @@ IMPORTANT:
         fixes: dict[str, str],
         translated_csv: Path,
         output_csv: Path | None = None,
+        csv_file: bool = True,
+        memory: TranslationMemory | None = None,
     ) -> int:
         """
-        Apply fixes to translated CSV.
+        Apply fixes to the translated table.
         
+        Writes the string store, plus the CSV unless ``csv_file`` is False.
+        Fixed translations replace the old ones in ``memory`` if given.
         Returns number of rows updated.
         """
         if output_csv is None:
             output_csv = translated_csv
         
-        rows = []
-        fieldnames = None
+        table = open_table(translated_csv)
+        if table is None:
+            raise FileNotFoundError(f"Translations not found: {translated_csv}")
         
-        with open(translated_csv, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            fieldnames = reader.fieldnames
-            rows = list(reader)
+        with table:
+            fieldnames = table.columns
+            rows = [list(row) for row in table.iter_rows(*fieldnames)]
+        
+        id_idx = fieldnames.index("ID")
+        ru_idx = fieldnames.index("Russian")
+        en_idx = fieldnames.index("English")
+        orig_idx = fieldnames.index("Original")
         
         updated = 0
+        remembered: list[tuple[str, str, str]] = []
         for row in rows:
-            if row["ID"] in fixes:
-                row["Russian"] = fixes[row["ID"]]
+            if row[id_idx] in fixes:
+                row[ru_idx] = fixes[row[id_idx]]
+                remembered.append((row[en_idx], row[orig_idx], row[ru_idx]))
                 updated += 1
         
-        with open(output_csv, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-            writer.writeheader()
+        with TableWriter(output_csv, fieldnames, csv_file=csv_file) as writer:
             writer.writerows(rows)
         
+        if memory is not None:
+            memory.add_many(remembered)
+        
         return updated
-
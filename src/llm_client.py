@@ -5,24 +5,29 @@ import contextlib
 import json
 import logging
 import time
+from collections.abc import Callable
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, BaseMessageChunk, HumanMessage, SystemMessage
 from tenacity import (
+    RetryCallState,
     after_log,
     before_sleep_log,
     retry,
     retry_if_exception_type,
-    stop_after_attempt,
     wait_exponential,
 )
 
+from .batch_planner import BatchPlanner
 from .config import EnvConfig, LLMConfig, get_config, get_env_config
 from .models import ErrorMarkers
+from .response_cache import ResponseCache
+from .tokenizer import TokenCounter
 
 
 logger = logging.getLogger(__name__)
@@ -39,7 +44,39 @@ class ConfigurationError(LLMClientError):
 class TransientError(LLMClientError):
     """Transient error - should retry."""
 class IncompleteResponseError(LLMClientError):
-    """LLM returned fewer items than expected - should retry."""
+    """LLM returned fewer items than expected; ``items`` holds the leading ones that parsed."""
+
+    def __init__(self, message: str, items: list[str] | None = None):
+        super().__init__(message)
+        self.items = items or []
+class CircuitOpenError(LLMClientError):
+    """Circuit breaker open - requests are refused until it recovers."""
+
+
+# Failures of the backend rather than of the batch: another backend or a later retry may succeed
+SYSTEMIC_ERRORS = (CircuitOpenError, ConfigurationError, QuotaExceededError, RateLimitError, TransientError)
+
+
+# Duration of the current task's latest model call; excludes rate-limiter waits and retry backoff
+_model_latency: ContextVar[float | None] = ContextVar("model_latency", default=None)
+
+
+def reset_model_latency() -> None:
+    """Forget the current task's last model call latency (call before a new batch)."""
+    _model_latency.set(None)
+
+
+def model_latency() -> float | None:
+    """Seconds the current task's latest successful model call took, None if there was none."""
+    return _model_latency.get()
+
+
+def _stop_after_client_attempts(retry_state: RetryCallState) -> bool:
+    """tenacity stop condition: the client's own ``max_attempts`` (``self`` is args[0])."""
+    client: LLMClient = retry_state.args[0]
+    return retry_state.attempt_number >= client.max_attempts
+
+
 class ErrorType(Enum):
     """Error classification for retry decisions."""
 
@@ -51,30 +88,73 @@ class ErrorType(Enum):
 
 @dataclass(slots=True)
 class RateLimiter:
-    """Token bucket rate limiter for API calls."""
+    """Dual token bucket: requests per minute and LLM tokens per minute (0 = unlimited).
+
+    ``acquire`` takes the estimated tokens of a request up front; ``reconcile`` settles
+    the difference once the provider reports actual usage.
+    """
 
     requests_per_minute: int = 60
-    _tokens: float = field(default=60.0, repr=False)
+    tokens_per_minute: int = 0
+    _requests: float = field(default=-1.0, repr=False)
+    _tokens: float = field(default=-1.0, repr=False)
     _last_update: float = field(default_factory=time.time, repr=False)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
-    async def acquire(self) -> None:
-        """Wait until a request token is available."""
+    def __post_init__(self) -> None:
+        if self._requests < 0:
+            self._requests = float(self.requests_per_minute)
+        if self._tokens < 0:
+            self._tokens = float(self.tokens_per_minute)
+
+    def _refill(self) -> None:
+        now = time.time()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self._requests = min(
+            self.requests_per_minute, self._requests + elapsed * (self.requests_per_minute / 60.0)
+        )
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * (self.tokens_per_minute / 60.0))
+
+    def _wait_time(self, tokens: int) -> float:
+        wait = 0.0
+        if self.requests_per_minute and self._requests < 1:
+            wait = (1 - self._requests) / (self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            # A request larger than the whole bucket only waits for a full bucket
+            needed = min(tokens, self.tokens_per_minute)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) / (self.tokens_per_minute / 60.0))
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request (of ``tokens`` estimated tokens) fits both buckets."""
         async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_update
-            self._tokens = min(
-                self.requests_per_minute, self._tokens + elapsed * (self.requests_per_minute / 60.0)
-            )
-            self._last_update = now
-
-            if self._tokens < 1:
-                wait_time = (1 - self._tokens) / (self.requests_per_minute / 60.0)
+            self._refill()
+            if (wait_time := self._wait_time(tokens)) > 0:
                 logger.debug(f"Rate limit: waiting {wait_time:.2f}s")
                 await asyncio.sleep(wait_time)
-                self._tokens = 0
-            else:
-                self._tokens -= 1
+                self._refill()
+
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+
+    def headroom(self) -> float:
+        """Fraction of both buckets currently available (1.0 when unlimited)."""
+        self._refill()
+        shares = [1.0]
+        if self.requests_per_minute:
+            shares.append(max(0.0, self._requests) / self.requests_per_minute)
+        if self.tokens_per_minute:
+            shares.append(max(0.0, self._tokens) / self.tokens_per_minute)
+        return min(shares)
+
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket by the actual usage of a request (may go negative)."""
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + estimated - actual)
 
 
 @dataclass
@@ -134,12 +214,28 @@ class LLMClient:
         self,
         llm_config: LLMConfig | None = None,
         env_config: EnvConfig | None = None,
+        api_key: str | None = None,
+        cache: ResponseCache | None = None,
+        max_attempts: int = 5,
     ):
         self._config = llm_config or get_config().llm
         self._env = env_config or get_env_config()
+        self._api_key = api_key  # Overrides the provider's key from .env
+        self.max_attempts = max_attempts  # Per request, for rate limits and transient errors
         self._model: BaseChatModel | None = None
-        self._rate_limiter = RateLimiter(requests_per_minute=30)  # Conservative for free tier
+        limits = self._config.limits()
+        self._rate_limiter = RateLimiter(
+            requests_per_minute=limits.requests_per_minute,
+            tokens_per_minute=limits.tokens_per_minute,
+        )
         self._circuit_breaker = CircuitBreaker()
+        # Own counter: the shared one follows whichever model asked last (pools mix models)
+        self._token_counter = TokenCounter(self._config.model)
+        self.rate_limit_hits = 0  # Rate-limit errors seen, for adaptive concurrency
+        self.cache_read_tokens = 0  # Prompt tokens the provider served from its prompt cache
+        self._cache: ResponseCache | None = cache  # May be shared, e.g. by the backends of a pool
+        if self._cache is None and self._config.cache:
+            self._cache = ResponseCache(self._config.cache_dir, self._config.cache_max_mb * 1024 * 1024)
         self._init_model()
 
     def _init_model(self) -> None:
@@ -164,7 +260,7 @@ class LLMClient:
         """Initialize OpenRouter."""
         from langchain_openai import ChatOpenAI
 
-        if api_key := self._env.openrouter_api_key:
+        if api_key := self._api_key or self._env.openrouter_api_key:
             self._model = ChatOpenAI(
                 model=self._config.model,
                 temperature=self._config.temperature,
@@ -172,6 +268,7 @@ class LLMClient:
                 timeout=self._config.timeout,
                 api_key=api_key,
                 base_url=self.OPENROUTER_BASE_URL,
+                stream_usage=True,  # Token usage (and cache hits) on streamed responses too
                 default_headers={
                     "HTTP-Referer": "https://github.com/wwm-translator",
                     "X-Title": "WWM Translator",
@@ -184,7 +281,7 @@ class LLMClient:
         """Initialize OpenAI."""
         from langchain_openai import ChatOpenAI
 
-        api_key = self._env.openai_api_key
+        api_key = self._api_key or self._env.openai_api_key
         if not api_key:
             raise ConfigurationError("OPENAI_API_KEY not set")
 
@@ -194,6 +291,7 @@ class LLMClient:
             "max_tokens": self._config.max_tokens,
             "timeout": self._config.timeout,
             "api_key": api_key,
+            "stream_usage": True,  # Token usage (and cache hits) on streamed responses too
         }
 
         if base_url := self._env.openai_api_base:
@@ -205,7 +303,7 @@ class LLMClient:
         """Initialize Anthropic."""
         from langchain_anthropic import ChatAnthropic
 
-        if api_key := self._env.anthropic_api_key:
+        if api_key := self._api_key or self._env.anthropic_api_key:
             self._model = ChatAnthropic(
                 model=self._config.model,
                 temperature=self._config.temperature,
@@ -220,7 +318,7 @@ class LLMClient:
         """Initialize Google Gemini."""
         from langchain_google_genai import ChatGoogleGenerativeAI
 
-        if api_key := self._env.google_api_key:
+        if api_key := self._api_key or self._env.google_api_key:
             self._model = ChatGoogleGenerativeAI(
                 model=self._config.model,
                 temperature=self._config.temperature,
@@ -237,6 +335,16 @@ class LLMClient:
             raise LLMClientError("Model not initialized")
         return self._model
 
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is open."""
+        return self._circuit_breaker.can_proceed()
+
+    @property
+    def headroom(self) -> float:
+        """Share of the rate limit currently unused (0-1)."""
+        return self._rate_limiter.headroom()
+
     def _classify_error(self, error: Exception) -> ErrorType:
         """Classify error for retry decision."""
         error_str = str(error).lower()
@@ -255,67 +363,158 @@ class LLMClient:
 
         return ErrorType.PERMANENT
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=4, max=120),
-        retry=retry_if_exception_type((RateLimitError, TransientError, IncompleteResponseError)),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        after=after_log(logger, logging.DEBUG),
-        reraise=True,
-    )
+    MAX_FOLLOWUPS = 3  # Follow-up requests for the missing tail of a partial response
+
     async def translate_batch(
         self,
         texts: list[dict[str, str]],
         system_prompt: str,
         context_before: list[dict[str, str]] | None = None,
         context_after: list[dict[str, str]] | None = None,
+        *,
+        references: list[dict[str, str]] | None = None,
+        on_item: Callable[[int, str], None] | None = None,
     ) -> list[str]:
         """
         Translate a batch of texts with retry and rate limiting.
 
+        If a response is cut short, the items that parsed are kept and only the
+        remaining texts are requested again (with the kept ones as context). A complete
+        response with items missing can't be lined up and raises IncompleteResponseError;
+        its ``items`` are the translations kept before that (streamed ones beyond them
+        must be discarded).
+
         Args:
             texts: List of dicts with 'english', 'original', 'id' keys
             system_prompt: System prompt with instructions
             context_before: Previous translated texts for reference
             context_after: Next texts (preview, do not translate)
+            references: Similar earlier translations from the translation memory
+            on_item: Called with (index, translation) as each item arrives (streaming only)
 
         Returns:
             List of translations in same order
         """
-        if not self._circuit_breaker.can_proceed():
-            raise LLMClientError("Circuit breaker open - too many failures")
+        context_before = context_before or []
+        context_after = context_after or []
+        references = references or []
+
+        results: list[str] = []
+        remaining = texts
+        before = context_before
+        for attempt in range(self.MAX_FOLLOWUPS + 1):
+            emit = None
+            if on_item is not None:
+                emit = lambda index, item, offset=len(results): on_item(offset + index, item)  # noqa: E731
+            try:
+                results += await self._request(
+                    remaining, system_prompt, before, context_after, references=references, on_item=emit
+                )
+                break
+            except IncompleteResponseError as e:
+                kept = e.items[: len(remaining)]
+                if attempt == self.MAX_FOLLOWUPS or not kept:
+                    # Give up; ``items`` are the translations that line up with ``texts``
+                    raise IncompleteResponseError(str(e), results + kept) from e
+                logger.warning(
+                    f"Partial response: kept {len(kept)}/{len(remaining)}, "
+                    f"re-requesting {len(remaining) - len(kept)}"
+                )
+                before = before + [{**item, "translated": tr} for item, tr in zip(remaining, kept)]
+                results += kept
+                remaining = remaining[len(kept) :]
+
+        if remaining is not texts and self._cache is not None:
+            # Replays of the original request get the assembled result
+            user_message = self._build_message(texts, context_before, context_after, references)
+            key = ResponseCache.key(self._config.model, self._config.temperature, system_prompt, user_message)
+            with contextlib.suppress(OSError):
+                self._cache.put(key, json.dumps(results, ensure_ascii=False))
+
+        return results
+
+    @retry(
+        stop=_stop_after_client_attempts,
+        wait=wait_exponential(multiplier=2, min=4, max=120),
+        retry=retry_if_exception_type((RateLimitError, TransientError)),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        after=after_log(logger, logging.DEBUG),
+        reraise=True,
+    )
+    async def _request(
+        self,
+        texts: list[dict[str, str]],
+        system_prompt: str,
+        context_before: list[dict[str, str]],
+        context_after: list[dict[str, str]],
+        *,
+        references: list[dict[str, str]],
+        on_item: Callable[[int, str], None] | None = None,
+    ) -> list[str]:
+        """One request (with retries on rate limits and transient errors)."""
+        user_message = self._build_message(texts, context_before, context_after, references)
+
+        cache_key = ""
+        if self._cache is not None:
+            cache_key = ResponseCache.key(
+                self._config.model, self._config.temperature, system_prompt, user_message
+            )
+            if (cached := self._cache.get(cache_key)) is not None:
+                try:
+                    result = self._parse_response(cached, len(texts))
+                    logger.debug("LLM response served from cache")
+                    return result
+                except LLMClientError:
+                    self._cache.discard(cache_key)
 
-        await self._rate_limiter.acquire()
+        if not self._circuit_breaker.can_proceed():
+            raise CircuitOpenError("Circuit breaker open - too many failures")
 
-        user_message = self._build_message(
-            texts,
-            context_before or [],
-            context_after or [],
-        )
+        estimated = self._estimate_tokens(texts, system_prompt, user_message)
+        await self._rate_limiter.acquire(estimated)
 
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message(system_prompt),
             HumanMessage(content=user_message),
         ]
 
         try:
             start_time = time.time()
-            response = await self.model.ainvoke(messages)
+            if self._config.streaming:
+                response = await self._stream(messages, len(texts), on_item)
+            else:
+                response = await self.model.ainvoke(messages)
             elapsed = time.time() - start_time
+            _model_latency.set(elapsed)
+
+            if usage := getattr(response, "usage_metadata", None):
+                actual = usage.get("total_tokens") or usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+                self._rate_limiter.reconcile(estimated, actual)
+                self.cache_read_tokens += (usage.get("input_token_details") or {}).get("cache_read") or 0
 
             logger.debug(f"LLM response in {elapsed:.2f}s")
 
-            result = self._parse_response(str(response.content), len(texts))
+            content = str(response.content)
             self._circuit_breaker.record_success()
+            result = self._parse_response(content, len(texts))
+
+            if self._cache is not None and not any(ErrorMarkers.contains_error(item) for item in result):
+                with contextlib.suppress(OSError):
+                    self._cache.put(cache_key, content)
 
             return result
 
+        except IncompleteResponseError:
+            raise
+
         except Exception as e:
             self._circuit_breaker.record_failure()
             error_type = self._classify_error(e)
 
             match error_type:
                 case ErrorType.RATE_LIMIT:
+                    self.rate_limit_hits += 1
+                    self._rate_limiter.reconcile(estimated, 0)  # Rejected requests use no tokens
                     logger.warning(f"Rate limit hit: {e}")
                     raise RateLimitError(str(e)) from e
                 case ErrorType.QUOTA:
@@ -328,27 +527,106 @@ class LLMClient:
                     logger.error(f"Permanent error: {e}")
                     raise LLMClientError(str(e)) from e
 
+    # OpenRouter models that cache only at explicit breakpoints (the rest cache prefixes automatically)
+    CACHE_CONTROL_MODELS = ("anthropic/", "google/gemini")
+
+    def _system_message(self, system_prompt: str) -> SystemMessage:
+        """System message, marked as a prompt-cache breakpoint where the provider needs one.
+
+        The system prompt is identical for every batch and always comes first, so it is
+        the cacheable prefix: OpenAI and most OpenRouter models reuse it automatically,
+        Anthropic (direct or via OpenRouter) and Gemini via OpenRouter need ``cache_control``.
+        """
+        provider = self._config.provider.lower()
+        model = self._config.model.lower()
+        if self._config.prompt_caching and (
+            provider == "anthropic" or (provider == "openrouter" and model.startswith(self.CACHE_CONTROL_MODELS))
+        ):
+            return SystemMessage(
+                content=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            )
+        return SystemMessage(content=system_prompt)
+
+    async def _stream(
+        self,
+        messages: list[BaseMessage],
+        expected: int,
+        on_item: Callable[[int, str], None] | None,
+    ) -> BaseMessage:
+        """Stream the response, passing each array item to ``on_item`` once it is complete.
+
+        If the stream breaks off, the complete items are kept (IncompleteResponseError).
+        """
+        parser = JsonArrayStream()
+        message: BaseMessageChunk | None = None
+        try:
+            async with asyncio.timeout(self._config.timeout):
+                async for chunk in self.model.astream(messages):
+                    message = chunk if message is None else message + chunk
+                    for value in parser.feed(str(chunk.content)):
+                        index = len(parser.items) - 1
+                        if on_item is not None and index < expected:
+                            on_item(index, str(value))
+        except Exception as e:
+            if isinstance(e, TimeoutError):
+                e = TimeoutError(f"Stream timeout after {self._config.timeout}s")
+            if parser.closed and message is not None:
+                # The array is complete; _parse_response decides whether it lines up
+                logger.debug(f"Stream ended with an error after the response: {e}")
+                return message
+            if not parser.items:
+                raise e
+            # Cut off before the closing bracket: the complete leading items line up
+            items = [str(value) for value in parser.items]
+            raise IncompleteResponseError(f"Stream failed after {len(items)} items: {e}", items) from e
+
+        if message is None:
+            raise TransientError("Empty response stream")
+        return message
+
+    def _estimate_tokens(self, texts: list[dict[str, str]], system_prompt: str, user_message: str) -> int:
+        """Prompt + expected response tokens, for the tokens-per-minute bucket."""
+        if not self._rate_limiter.tokens_per_minute:
+            return 0
+        counter = self._token_counter
+        prompt = counter.count_tokens(system_prompt) + counter.count_tokens(user_message)
+        response = sum(counter.count_tokens(item.get("english", "")) for item in texts)
+        return prompt + int(response * BatchPlanner.OUTPUT_RATIO)
+
     def translate_batch_sync(
         self,
         texts: list[dict[str, str]],
         system_prompt: str,
         context_before: list[dict[str, str]] | None = None,
         context_after: list[dict[str, str]] | None = None,
+        *,
+        references: list[dict[str, str]] | None = None,
     ) -> list[str]:
         """Synchronous wrapper."""
         return asyncio.run(
-            self.translate_batch(texts, system_prompt, context_before, context_after)
+            self.translate_batch(
+                texts, system_prompt, context_before, context_after, references=references
+            )
         )
 
+    @staticmethod
     def _build_message(
-        self,
         texts: list[dict[str, str]],
         context_before: list[dict[str, str]],
         context_after: list[dict[str, str]],
+        references: list[dict[str, str]] | None = None,
     ) -> str:
         """Build user message for translation request."""
         lines: list[str] = []
 
+        if references:
+            lines.append("=== SIMILAR (earlier translations, keep wording consistent) ===")
+            for item in references:
+                lines.append(f"EN: {item.get('english', '')}")
+                if zh := item.get("original"):
+                    lines.append(f"ZH: {zh}")
+                lines.extend((f"RU: {item.get('translated', '')}", ""))
+
         if context_before:
             lines.append("=== REFERENCE (previously translated) ===")
             for item in context_before[-3:]:
@@ -380,7 +658,8 @@ class LLMClient:
         )
         return "\n".join(lines)
 
-    def _parse_response(self, content: str, expected_count: int) -> list[str]:
+    @classmethod
+    def _parse_response(cls, content: str, expected_count: int) -> list[str]:
         """Parse LLM response and extract translations."""
         content = content.strip()
         
@@ -392,32 +671,46 @@ class LLMClient:
             try:
                 result = json.loads(content[start:end])
                 if isinstance(result, list):
-                    return self._normalize_list(result, expected_count)
+                    # A complete but short array skipped or merged items somewhere, so
+                    # the ones it has can't be matched to their inputs
+                    return cls._normalize_list(result, expected_count, salvage=False)
             except json.JSONDecodeError:
                 pass
         
+        # A closed array followed by text with brackets in it, or a truncated array (e.g.
+        # output token limit); only the truncated one may keep its complete leading items
+        if start != -1 and (leading := _leading_items(content, start)) is not None:
+            items, closed = leading
+            if closed:
+                return cls._normalize_list(items, expected_count, salvage=False)
+            if items:
+                return cls._normalize_list(items, expected_count)
+        
         # Fallback: try to parse entire content as JSON
         try:
             result = json.loads(content)
             if isinstance(result, list):
-                return self._normalize_list(result, expected_count)
+                return cls._normalize_list(result, expected_count, salvage=False)
         except json.JSONDecodeError:
             pass
         
         # Last resort: split by newlines if looks like list
         lines = [line.strip().strip('"').strip("'") for line in content.split("\n") if line.strip()]
         if lines:
-            return self._normalize_list(lines, expected_count)
+            # Free-form lines can't be trusted to line up, so a short list isn't salvaged
+            return cls._normalize_list(lines, expected_count, salvage=False)
         
         return [ErrorMarkers.PARSE_ERROR] * expected_count
 
-    def _normalize_list(self, items: list, expected: int) -> list[str]:
+    @staticmethod
+    def _normalize_list(items: list, expected: int, salvage: bool = True) -> list[str]:
         """Normalize result list to expected length."""
         result = [str(x) for x in items]
 
         if len(result) < expected:
             raise IncompleteResponseError(
-                f"Got {len(result)} items, expected {expected} - retrying..."
+                f"Got {len(result)} items, expected {expected}",
+                result if salvage else None,
             )
         elif len(result) > expected:
             result = result[:expected]
@@ -425,6 +718,96 @@ class LLMClient:
         return result
 
 
+class JsonArrayStream:
+    """Incremental parser for a JSON array that arrives in chunks.
+
+    ``feed`` returns the items completed by the chunk. An item counts as complete once
+    the following ``,`` or ``]`` has arrived, so a value is never reported half-read.
+    Text before the opening ``[`` (e.g. a code fence) is ignored.
+    """
+
+    __slots__ = ("_buffer", "_decoder", "_pos", "closed", "items")
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+        self._pos = -1  # Parse position, -1 until the opening bracket is seen
+        self.closed = False  # Closing bracket (or malformed input) reached
+        self.items: list = []
+
+    def feed(self, chunk: str) -> list:
+        self._buffer += chunk
+        if self._pos < 0:
+            start = self._buffer.find("[")
+            if start < 0:
+                return []
+            self._pos = start + 1
+
+        buffer = self._buffer
+        length = len(buffer)
+        new: list = []
+        while not self.closed:
+            pos = self._pos
+            while pos < length and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos >= length:
+                break
+            if buffer[pos] == "]":
+                self.closed = True
+                break
+            try:
+                value, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Item still incomplete (or malformed; the full parse decides)
+            while end < length and buffer[end] in " \t\r\n":
+                end += 1
+            if end >= length:
+                break  # Wait for the delimiter: a number or literal may continue
+            if buffer[end] == ",":
+                self._pos = end + 1
+            elif buffer[end] == "]":
+                self._pos = end
+            else:
+                self.closed = True
+                break
+            self.items.append(value)
+            new.append(value)
+        return new
+
+
+def _leading_items(content: str, start: int) -> tuple[list, bool] | None:
+    """Values of a JSON array starting at ``start`` and whether the array is complete.
+
+    ``closed`` is True once the closing ``]`` is reached; the items are then the whole
+    array, whatever text follows it. An array the input ends inside of (e.g. at the output
+    token limit) gives its complete leading items with ``closed`` False. None if the
+    array is malformed before the input runs out.
+    """
+    decoder = json.JSONDecoder()
+    items: list = []
+    pos = start + 1
+    length = len(content)
+    while True:
+        while pos < length and content[pos] in " \t\r\n":
+            pos += 1
+        if pos >= length or content[pos] == "]":
+            return items, pos < length
+        try:
+            value, pos = decoder.raw_decode(content, pos)
+        except json.JSONDecodeError as e:
+            # Cut off inside the value, or it is not JSON at all
+            if e.msg.startswith("Unterminated string") or e.pos >= len(content.rstrip()):
+                return items, False
+            return None
+        items.append(value)
+        while pos < length and content[pos] in " \t\r\n":
+            pos += 1
+        if pos < length and content[pos] == ",":
+            pos += 1
+        elif pos < length and content[pos] != "]":
+            return None
+
+
 class PromptBuilder:
     """Translation prompt builder with caching."""
 
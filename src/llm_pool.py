@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .config import EnvConfig, LLMConfig, get_config, get_env_config
+from .llm_client import (
+    SYSTEMIC_ERRORS,
+    CircuitOpenError,
+    ConfigurationError,
+    LLMClient,
+    LLMClientError,
+    RateLimitError,
+    TransientError,
+)
+from .response_cache import ResponseCache
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PoolBackend:
+    """One pooled client with its routing statistics."""
+
+    name: str
+    client: LLMClient
+    weight: float = 1.0
+    in_flight: int = 0
+    latency: float = 0.0  # Moving average of successful request times (s)
+    requests: int = 0
+    failures: int = 0
+    cooldown_until: float = 0.0  # Ranked last until then, after a rate limit or outage
+
+    LATENCY_SMOOTHING = 0.2
+    COOLDOWN = 30.0  # Seconds a failed backend stays at the back of the ranking
+    COOLDOWN_PENALTY = 0.01
+
+    def score(self) -> float:
+        """Higher is better: weight x rate-limit headroom, per queued request and second."""
+        latency = self.latency or 1.0  # Untried backends look average
+        score = self.weight * (0.1 + self.client.headroom) / ((self.in_flight + 1) * latency)
+        if time.time() < self.cooldown_until:
+            score *= self.COOLDOWN_PENALTY
+        return score
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.cooldown_until = time.time() + self.COOLDOWN
+
+    def record(self, elapsed: float) -> None:
+        self.requests += 1
+        if self.latency:
+            self.latency += self.LATENCY_SMOOTHING * (elapsed - self.latency)
+        else:
+            self.latency = elapsed
+
+
+class LLMPool:
+    """Load-balanced set of LLM clients (providers, models or API keys).
+
+    Each backend keeps its own rate limiter and circuit breaker; the response cache is
+    shared. A batch goes to the available backend with the best score; if that backend is
+    down, out of quota or rate limited, the batch moves on to the next one at once (the
+    failed backend is ranked last for a while), so an outage costs throughput, not the
+    run. Backends don't retry on their own: only when every backend has failed does the
+    pool back off and try them all again. Errors about the batch itself (e.g. an
+    incomplete response) are raised at once.
+    """
+
+    ROUNDS = 5  # Passes over all backends for rate limits and transient errors
+    MIN_BACKOFF = 4.0
+    MAX_BACKOFF = 120.0
+
+    __slots__ = ("backends",)
+
+    def __init__(self, backends: list[PoolBackend]):
+        if not backends:
+            raise ConfigurationError("LLM pool needs at least one backend")
+        self.backends = backends
+
+    @classmethod
+    def from_config(cls, llm_config: LLMConfig, env_config: EnvConfig | None = None) -> LLMPool:
+        env_config = env_config or get_env_config()
+        cache = None
+        if llm_config.cache:
+            cache = ResponseCache(llm_config.cache_dir, llm_config.cache_max_mb * 1024 * 1024)
+        backends = []
+        for backend in llm_config.backends:
+            update: dict = {
+                "provider": backend.provider or llm_config.provider,
+                "model": backend.model or llm_config.model,
+                "backends": [],
+            }
+            if backend.rate_limit is not None:
+                update |= {"rate_limit": backend.rate_limit, "rate_limits": {}}
+            config = llm_config.model_copy(update=update)
+
+            api_key = None
+            if backend.api_key_env:
+                api_key = os.environ.get(backend.api_key_env)
+                if not api_key:
+                    raise ConfigurationError(f"{backend.api_key_env} not set")
+
+            name = f"{config.provider}/{config.model}"
+            if backend.api_key_env:
+                name += f" ({backend.api_key_env})"
+            # The pool fails over instead of retrying, see translate_batch
+            client = LLMClient(config, env_config, api_key=api_key, cache=cache, max_attempts=1)
+            backends.append(PoolBackend(name, client, backend.weight))
+
+        logger.info(f"LLM pool: {', '.join(b.name for b in backends)}")
+        return cls(backends)
+
+    @property
+    def rate_limit_hits(self) -> int:
+        return sum(backend.client.rate_limit_hits for backend in self.backends)
+
+    @property
+    def cache_read_tokens(self) -> int:
+        return sum(backend.client.cache_read_tokens for backend in self.backends)
+
+    def _ranked(self, exclude: set[int]) -> list[PoolBackend]:
+        candidates = [b for i, b in enumerate(self.backends) if i not in exclude and b.client.available]
+        return sorted(candidates, key=PoolBackend.score, reverse=True)
+
+    async def translate_batch(
+        self,
+        texts: list[dict[str, str]],
+        system_prompt: str,
+        context_before: list[dict[str, str]] | None = None,
+        context_after: list[dict[str, str]] | None = None,
+        *,
+        references: list[dict[str, str]] | None = None,
+        on_item: Callable[[int, str], None] | None = None,
+    ) -> list[str]:
+        """Translate on the best backend, failing over to the others on systemic errors."""
+        last_error: Exception | None = None
+
+        for round_ in range(self.ROUNDS):
+            if round_:
+                wait = min(self.MAX_BACKOFF, self.MIN_BACKOFF * 2 ** (round_ - 1))
+                logger.warning(f"All backends failed, retrying in {wait:.0f}s: {last_error}")
+                await asyncio.sleep(wait)
+
+            tried: set[int] = set()
+            while ranked := self._ranked(tried):
+                backend = ranked[0]
+                tried.add(self.backends.index(backend))
+
+                backend.in_flight += 1
+                start = time.time()
+                try:
+                    result = await backend.client.translate_batch(
+                        texts,
+                        system_prompt,
+                        context_before,
+                        context_after,
+                        references=references,
+                        on_item=on_item,
+                    )
+                except LLMClientError as e:
+                    if not isinstance(e, SYSTEMIC_ERRORS):
+                        backend.failures += 1
+                        raise
+                    backend.record_failure()
+                    last_error = e
+                    logger.warning(f"{backend.name} failed, trying next backend: {e}")
+                    continue
+                finally:
+                    backend.in_flight -= 1
+
+                backend.record(time.time() - start)
+                return result
+
+            # Quota, configuration and open circuits don't clear up within a backoff
+            if not isinstance(last_error, (RateLimitError, TransientError)):
+                break
+
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError("No LLM backend available (all circuit breakers open)")
+
+    def translate_batch_sync(
+        self,
+        texts: list[dict[str, str]],
+        system_prompt: str,
+        context_before: list[dict[str, str]] | None = None,
+        context_after: list[dict[str, str]] | None = None,
+        *,
+        references: list[dict[str, str]] | None = None,
+    ) -> list[str]:
+        """Synchronous wrapper."""
+        return asyncio.run(
+            self.translate_batch(
+                texts, system_prompt, context_before, context_after, references=references
+            )
+        )
+
+    def stats(self) -> list[tuple[str, str]]:
+        """(backend name, summary) per backend."""
+        return [
+            (b.name, f"{b.requests} ok, {b.failures} failed, {b.latency:.1f}s avg")
+            for b in self.backends
+        ]
+
+def create_llm_client(
+    llm_config: LLMConfig | None = None,
+    env_config: EnvConfig | None = None,
+) -> LLMClient | LLMPool:
+    """Single client, or a pool when ``llm.backends`` is configured."""
+    llm_config = llm_config or get_config().llm
+    if llm_config.backends:
+        return LLMPool.from_config(llm_config, env_config)
+    return LLMClient(llm_config, env_config)
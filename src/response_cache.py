@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Content-addressed on-disk store of raw LLM responses.
+
+    One file per request fingerprint, sharded by the first two hex digits. Reads touch the
+    file, and when the total size passes ``max_bytes`` the least recently used responses
+    are removed until it is back under 90% of the limit.
+    """
+
+    SUFFIX = ".txt"
+
+    __slots__ = ("_size", "directory", "max_bytes")
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(path.stat().st_size for path in self._files())
+
+    @staticmethod
+    def key(model: str, temperature: float, system_prompt: str, user_message: str) -> str:
+        """Fingerprint of a request: model, temperature, system prompt hash and user message."""
+        prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        payload = json.dumps([model, temperature, prompt_hash, user_message], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _files(self) -> list[Path]:
+        return list(self.directory.glob(f"*/*{self.SUFFIX}"))
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        encoded = content.encode("utf-8")
+        previous = path.stat().st_size if path.exists() else 0
+
+        temp = path.with_suffix(".tmp")
+        temp.write_bytes(encoded)
+        temp.replace(path)
+
+        self._size += len(encoded) - previous
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def discard(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        self._size -= size
+
+    def clear(self) -> int:
+        """Remove all cached responses. Returns the number removed."""
+        removed = 0
+        for path in self._files():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to delete {path}: {e}")
+        self._size = sum(path.stat().st_size for path in self._files())
+        return removed
+
+    def _evict(self) -> None:
+        files = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        files.sort()
+
+        size = sum(entry[1] for entry in files)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, file_size, path in files:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= file_size
+            removed += 1
+
+        self._size = size
+        logger.debug(f"Response cache: evicted {removed} responses")
@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from pathlib import Path
+from typing import BinaryIO, Self
+
+
+logger = logging.getLogger(__name__)
+
+STORE_SUFFIX = ".wst"
+
+_MAGIC = b"WWST"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQ")  # Magic(4) + Version(4) + DirectoryOffset(8) + DirectorySize(8)
+
+
+def store_path(csv_path: Path) -> Path:
+    """Store file that mirrors ``csv_path`` (``en.csv`` -> ``en.wst``)."""
+    return Path(csv_path).with_suffix(STORE_SUFFIX)
+
+
+class StoreColumn(Sequence[str]):
+    """One string column: a u64 offset array into a UTF-8 blob, decoded on access."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: memoryview, offsets: memoryview):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return str(self._data[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._data
+        offsets = self._offsets
+        start = 0
+        for i in range(1, len(offsets)):
+            end = offsets[i]
+            yield str(data[start:end], "utf-8")
+            start = end
+
+    def release(self) -> None:
+        self._data.release()
+        self._offsets.release()
+
+
+class StringStore:
+    """Read-only, memory-mapped columnar string table (``.wst``).
+
+    Holds the same columns as the CSV it mirrors. Opening is one mmap plus a small JSON
+    directory; strings are only decoded when read, and ``find`` looks rows up through
+    a sorted index on the key column instead of building a dict. Given ``data``, the
+    store is read from memory instead and ``path`` only names it.
+    """
+
+    __slots__ = ("_columns", "_file", "_index", "_key", "_mmap", "_view", "meta", "path", "rows")
+
+    def __init__(self, path: Path, data: bytes | None = None):
+        self.path = Path(path)
+        self._file: BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+        self._view = memoryview(b"")
+        self._columns: dict[str, StoreColumn] = {}
+        self._index: memoryview | None = None
+        self._key: StoreColumn | None = None
+        self.meta: dict[str, str] = {}
+        self.rows = 0
+
+        try:
+            if data is None:
+                self._file = open(self.path, "rb")
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mmap)
+            else:
+                self._view = memoryview(data)
+            self._parse()
+        except BaseException:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        if len(self._view) < _HEADER.size:
+            raise ValueError(f"Not a string store: {self.path}")
+        magic, version, dir_offset, dir_size = _HEADER.unpack_from(self._view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported string store: {self.path}")
+
+        directory = json.loads(bytes(self._view[dir_offset : dir_offset + dir_size]))
+        self.rows = directory["rows"]
+        self.meta = directory.get("meta", {})
+
+        for column in directory["columns"]:
+            offsets_end = column["offsets"] + (self.rows + 1) * 8
+            self._columns[column["name"]] = StoreColumn(
+                self._view[column["data"] : column["data"] + column["size"]],
+                self._view[column["offsets"] : offsets_end].cast("Q"),
+            )
+
+        if (key := directory.get("key")) is not None:
+            self._key = self._columns[key]
+            self._index = self._view[directory["index"] : directory["index"] + self.rows * 4].cast("I")
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    def column(self, name: str) -> StoreColumn:
+        return self._columns[name]
+
+    def iter_rows(self, *names: str) -> Iterator[tuple[str, ...]]:
+        """Rows as tuples of the given columns ("" for columns the table doesn't have)."""
+        return zip(*(self._columns.get(name) or repeat("", self.rows) for name in names))
+
+    def to_dict(self, value_column: str, key_column: str = "ID") -> dict[str, str]:
+        """Map key -> value for the whole table (later duplicates win, like the CSV loaders)."""
+        return dict(zip(self._columns[key_column], self._columns[value_column]))
+
+    def find(self, key: str) -> int | None:
+        """Row number of ``key`` via the sorted key index, or None."""
+        if self._index is None or self._key is None:
+            raise ValueError(f"{self.path.name} has no key index")
+        column = self._key
+        pos = bisect_left(self._index, key, key=column.__getitem__)
+        if pos < len(self._index) and column[self._index[pos]] == key:
+            return self._index[pos]
+        return None
+
+    def get(self, key: str, column: str, default: str | None = None) -> str | None:
+        row = self.find(key)
+        return default if row is None else self._columns[column][row]
+
+    def close(self) -> None:
+        for column in self._columns.values():
+            column.release()
+        self._columns = {}
+        if self._index is not None:
+            self._index.release()
+            self._index = None
+        self._key = None
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                logger.debug("String store mapping still referenced, deferring close")
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _StoreBuilder:
+    """A store being written row by row.
+
+    Each column's UTF-8 data goes straight to its own temporary file, so only the offset
+    arrays stay in memory; ``write`` then lays the columns out in the store format.
+    """
+
+    __slots__ = ("_data", "_key_idx", "_offsets", "header", "rows")
+
+    def __init__(self, header: Sequence[str], key: str | None = "ID"):
+        self.header = list(header)
+        self._key_idx = self.header.index(key) if key in self.header else None
+        self._data = [tempfile.TemporaryFile() for _ in self.header]
+        self._offsets = [array("Q", [0]) for _ in self.header]
+        self.rows = 0
+
+    def add(self, row: Sequence[str]) -> None:
+        width = len(row)
+        for i, (data, offsets) in enumerate(zip(self._data, self._offsets)):
+            encoded = row[i].encode("utf-8") if i < width else b""
+            data.write(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+        self.rows += 1
+
+    def _key_order(self, key_idx: int) -> array:
+        """Row numbers sorted by the key column."""
+        data = self._data[key_idx]
+        data.seek(0)
+        keys = StoreColumn(memoryview(data.read()), memoryview(self._offsets[key_idx]))
+        try:
+            return array("I", sorted(range(self.rows), key=keys.__getitem__))
+        finally:
+            keys.release()
+
+    def write(self, f: BinaryIO, meta: dict[str, str] | None = None) -> None:
+        """Write the store to ``f``, which must be empty and positioned at its start."""
+        directory: dict = {"rows": self.rows, "columns": [], "key": None, "meta": meta or {}}
+        f.write(bytes(_HEADER.size))
+
+        def align() -> int:
+            if padding := -f.tell() % 8:
+                f.write(bytes(padding))
+            return f.tell()
+
+        for name, data, offsets in zip(self.header, self._data, self._offsets):
+            column = {"name": name, "offsets": align(), "size": offsets[-1]}
+            f.write(offsets.tobytes())
+            column["data"] = f.tell()
+            data.seek(0)
+            shutil.copyfileobj(data, f)
+            directory["columns"].append(column)
+
+        if self._key_idx is not None:
+            directory["key"] = self.header[self._key_idx]
+            directory["index"] = align()
+            f.write(self._key_order(self._key_idx).tobytes())
+
+        encoded = json.dumps(directory, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        dir_offset = align()
+        f.write(encoded)
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, dir_offset, len(encoded)))
+
+    def save(self, path: Path, meta: dict[str, str] | None = None) -> None:
+        """Write the store to ``path`` atomically."""
+        path = Path(path)
+        temp = path.with_suffix(".tmp")
+        with open(temp, "wb") as f:
+            self.write(f, meta)
+        temp.replace(path)
+
+    def close(self) -> None:
+        for data in self._data:
+            data.close()
+        self._data = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def write_store(
+    path: Path,
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    *,
+    key: str | None = "ID",
+    meta: dict[str, str] | None = None,
+) -> int:
+    """Write rows to a store file atomically. Returns the number of rows."""
+    with _StoreBuilder(header, key) as builder:
+        for row in rows:
+            builder.add(row)
+        builder.save(path, meta)
+        return builder.rows
+
+
+def is_current(csv_path: Path) -> bool:
+    """True if the store for ``csv_path`` exists and is not older than the CSV."""
+    store = store_path(csv_path)
+    try:
+        store_mtime = store.stat().st_mtime_ns
+    except OSError:
+        return False
+    try:
+        return store_mtime >= Path(csv_path).stat().st_mtime_ns
+    except OSError:
+        return True  # Store-only table
+
+
+def table_exists(csv_path: Path) -> bool:
+    return Path(csv_path).exists() or store_path(csv_path).exists()
+
+
+def _read_csv(csv_path: Path) -> tuple[list[str], Iterator[list[str]], dict[str, str]]:
+    """Header, row iterator and store metadata of a CSV table."""
+    raw = Path(csv_path).read_bytes()
+    reader = csv.reader(io.StringIO(raw.decode("utf-8"), newline=""), delimiter=";")
+    header = next(reader, None) or []
+    return header, reader, {"csv_md5": hashlib.md5(raw).hexdigest()}
+
+
+def import_csv(csv_path: Path, key: str | None = "ID") -> int:
+    """(Re)build the store for ``csv_path`` from the CSV. Returns the number of rows."""
+    header, rows, meta = _read_csv(csv_path)
+    return write_store(store_path(csv_path), header, rows, key=key, meta=meta)
+
+
+def export_csv(csv_path: Path) -> int:
+    """Write ``csv_path`` from its store. Returns the number of rows."""
+    store = store_path(csv_path)
+    with StringStore(store) as table, TableWriter(csv_path, table.columns, store=False) as writer:
+        writer.writerows(table.iter_rows(*table.columns))
+        count = len(table)
+    # The CSV now has the store's content; keep the store the preferred source
+    os.utime(store)
+    return count
+
+
+def open_table(csv_path: Path, *, persist: bool = True) -> StringStore | None:
+    """Open the table behind ``csv_path``: its store if current, else imported from the CSV.
+
+    With ``persist`` False a stale store is rebuilt in memory only, so read-only callers
+    leave the ``.wst`` file alone. Returns None if neither file exists.
+    """
+    if not is_current(csv_path):
+        if not Path(csv_path).exists():
+            return None
+        if not persist:
+            header, rows, meta = _read_csv(csv_path)
+            buffer = io.BytesIO()
+            with _StoreBuilder(header) as builder:
+                for row in rows:
+                    builder.add(row)
+                builder.write(buffer, meta)
+            return StringStore(store_path(csv_path), data=buffer.getvalue())
+        logger.debug(f"Importing {Path(csv_path).name} into string store")
+        import_csv(csv_path)
+    return StringStore(store_path(csv_path))
+
+
+def source_digest(csv_path: Path) -> str:
+    """md5 of the table's CSV form, taken from the store when it is current.
+
+    Identifies a source table's content whichever backend it was written with.
+    """
+    if is_current(csv_path):
+        with StringStore(store_path(csv_path)) as table:
+            if digest := table.meta.get("csv_md5"):
+                return digest
+
+    hasher = hashlib.md5()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class _CsvSink:
+    """File-like target for ``csv.writer`` that hashes the CSV text and optionally saves it."""
+
+    __slots__ = ("_file", "hasher")
+
+    def __init__(self, file: io.TextIOBase | None):
+        self._file = file
+        self.hasher = hashlib.md5()
+
+    def write(self, text: str) -> None:
+        self.hasher.update(text.encode("utf-8"))
+        if self._file is not None:
+            self._file.write(text)
+
+
+class TableWriter:
+    """Writes a table as CSV and/or store in one pass (``csv.writer``-like interface).
+
+    The store is written on successful exit, after the CSV, so it is never older than
+    the CSV it mirrors. Its ``csv_md5`` matches the CSV bytes even when no CSV is written.
+    """
+
+    __slots__ = ("_builder", "_file", "_sink", "_writer", "csv_path")
+
+    def __init__(
+        self,
+        csv_path: Path,
+        header: Sequence[str],
+        *,
+        csv_file: bool = True,
+        store: bool = True,
+        key: str | None = "ID",
+    ):
+        self.csv_path = Path(csv_path)
+        self._builder = _StoreBuilder(header, key) if store else None
+        self._file = None
+        if csv_file:
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.csv_path, "w", encoding="utf-8", newline="")
+        self._sink = _CsvSink(self._file)
+        self._writer = csv.writer(self._sink, delimiter=";")
+        self._writer.writerow(header)
+
+    def writerow(self, row: Sequence[str]) -> None:
+        self._writer.writerow(row)
+        if self._builder is not None:
+            self._builder.add(row)
+
+    def writerows(self, rows: Iterable[Sequence[str]]) -> None:
+        for row in rows:
+            self.writerow(row)
+
+    def close(self, commit: bool = True) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._builder is None:
+            return
+        if commit:
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            self._builder.save(store_path(self.csv_path), {"csv_md5": self._sink.hasher.hexdigest()})
+        self._builder.close()
+        self._builder = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        self.close(commit=exc_type is None)
@@ -23,6 +23,7 @@ class TokenStats:
 
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_read_tokens: int = 0  # Input tokens served from the provider's prompt cache (reported usage)
 
     @property
     def total_tokens(self) -> int:
@@ -35,6 +36,7 @@ class TokenStats:
     def merge(self, other: TokenStats) -> None:
         self.input_tokens += other.input_tokens
         self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
 
     def estimate_cost(self, price_input: float, price_output: float) -> float:
         """Estimate cost in USD (prices per 1M tokens)."""
@@ -45,9 +47,10 @@ class TokenStats:
     def format_stats(self, price_input: float = 0.0, price_output: float = 0.0) -> str:
         cost = self.estimate_cost(price_input, price_output)
         cost_str = f"${cost:.4f}" if cost > 0 else "FREE"
+        cached_str = f", cached: {self.cache_read_tokens:,}" if self.cache_read_tokens else ""
         return (
             f"Tokens: {self.total_tokens:,} "
-            f"(in: {self.input_tokens:,}, out: {self.output_tokens:,}) | "
+            f"(in: {self.input_tokens:,}{cached_str}, out: {self.output_tokens:,}) | "
             f"Cost: {cost_str}"
         )
 
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import struct
+import time
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+
+logger = logging.getLogger(__name__)
+
+_NUM_PERM = 32
+_BANDS = 8  # 8 bands x 4 rows: pairs above ~0.6 trigram similarity usually share a band
+_ROWS = _NUM_PERM // _BANDS
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x574D)  # Fixed seed: signatures are persisted
+_PERMUTATIONS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_NUM_PERM))
+_BAND = struct.Struct(f"<B{_ROWS}Q")
+_SPACES = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    english TEXT NOT NULL,
+    original TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    updated REAL NOT NULL,
+    UNIQUE (target, english, original)
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    unit INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_band ON bands (band);
+CREATE INDEX IF NOT EXISTS bands_unit ON bands (unit);
+"""
+
+
+def _shingles(text: str) -> set[str]:
+    """Character trigrams of the case- and whitespace-normalized text."""
+    text = _SPACES.sub(" ", text.casefold()).strip()
+    if len(text) <= 3:
+        return {text} if text else set()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _band_keys(shingles: set[str]) -> list[int]:
+    """MinHash the shingles and fold each band of the signature into one 64-bit key."""
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    signature = [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+    keys = []
+    for band in range(_BANDS):
+        packed = _BAND.pack(band, *signature[band * _ROWS : (band + 1) * _ROWS])
+        keys.append(int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), "little", signed=True))
+    return keys
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryMatch:
+    """A stored translation similar to a queried text."""
+
+    english: str
+    original: str
+    translated: str
+    score: float
+
+    def to_dict(self) -> dict[str, str]:
+        return {"english": self.english, "original": self.original, "translated": self.translated}
+
+
+class TranslationMemory:
+    """SQLite store of accepted translations with a MinHash LSH index on the English text.
+
+    Exact lookups match (english, original) for the target language. Near duplicates are
+    found through 8 LSH bands over character-trigram MinHash signatures, then re-ranked by
+    the actual trigram similarity.
+    """
+
+    CANDIDATE_LIMIT = 50
+
+    __slots__ = ("_db", "path", "target")
+
+    def __init__(self, path: Path, target: str):
+        self.path = Path(path)
+        self.target = target
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM units WHERE target = ?", (self.target,)).fetchone()
+        return int(count)
+
+    def lookup(self, english: str, original: str = "") -> str | None:
+        """Stored translation for exactly this source pair, or None."""
+        row = self._db.execute(
+            "SELECT translated FROM units WHERE target = ? AND english = ? AND original = ?",
+            (self.target, english, original),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def similar(self, english: str, limit: int = 3, threshold: float = 0.7) -> list[MemoryMatch]:
+        """Stored translations whose English text is at least ``threshold`` similar, best first."""
+        shingles = _shingles(english)
+        if not shingles or limit <= 0:
+            return []
+
+        keys = _band_keys(shingles)
+        rows = self._db.execute(
+            f"""
+            SELECT u.english, u.original, u.translated FROM units u JOIN (
+                SELECT unit, COUNT(*) AS hits FROM bands
+                WHERE band IN ({",".join("?" * len(keys))})
+                GROUP BY unit ORDER BY hits DESC LIMIT ?
+            ) c ON c.unit = u.id
+            WHERE u.target = ?
+            """,
+            (*keys, self.CANDIDATE_LIMIT, self.target),
+        ).fetchall()
+
+        matches = [
+            MemoryMatch(en, zh, ru, score)
+            for en, zh, ru in rows
+            if (score := similarity(shingles, _shingles(en))) >= threshold
+        ]
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+    def add_many(self, items: Iterable[tuple[str, str, str]], *, replace: bool = True) -> int:
+        """Record (english, original, translated) triples. Returns the number of new units.
+
+        With ``replace=False`` existing units keep their translation.
+        """
+        added = 0
+        now = time.time()
+        with self._db:
+            for english, original, translated in items:
+                row = self._db.execute(
+                    "SELECT id FROM units WHERE target = ? AND english = ? AND original = ?",
+                    (self.target, english, original),
+                ).fetchone()
+                if row is not None:
+                    if replace:
+                        self._db.execute(
+                            "UPDATE units SET translated = ?, updated = ? WHERE id = ?",
+                            (translated, now, row[0]),
+                        )
+                    continue
+
+                cursor = self._db.execute(
+                    "INSERT INTO units (target, english, original, translated, updated) VALUES (?, ?, ?, ?, ?)",
+                    (self.target, english, original, translated, now),
+                )
+                if shingles := _shingles(english):
+                    self._db.executemany(
+                        "INSERT INTO bands (band, unit) VALUES (?, ?)",
+                        ((key, cursor.lastrowid) for key in _band_keys(shingles)),
+                    )
+                added += 1
+        return added
+
+    def remove_many(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """Forget the translations of (english, original) pairs. Returns the number removed."""
+        removed = 0
+        with self._db:
+            for english, original in pairs:
+                row = self._db.execute(
+                    "SELECT id FROM units WHERE target = ? AND english = ? AND original = ?",
+                    (self.target, english, original),
+                ).fetchone()
+                if row is None:
+                    continue
+                self._db.execute("DELETE FROM bands WHERE unit = ?", row)
+                self._db.execute("DELETE FROM units WHERE id = ?", row)
+                removed += 1
+        return removed
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
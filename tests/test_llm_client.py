@@ -0,0 +1,20 @@
+import pytest
+
+from src.llm_client import IncompleteResponseError, LLMClient
+
+
+def test_closed_short_array_with_trailing_brackets_is_not_salvaged():
+    # The array is complete: which inputs its two items belong to is unknown
+    with pytest.raises(IncompleteResponseError) as info:
+        LLMClient._parse_response('["a","b"]\nNote: [1]', 3)
+    assert info.value.items == []
+
+
+def test_closed_array_with_trailing_brackets_parses():
+    assert LLMClient._parse_response('["a","b","c"]\nNote: [1]', 3) == ["a", "b", "c"]
+
+
+def test_truncated_array_keeps_complete_leading_items():
+    with pytest.raises(IncompleteResponseError) as info:
+        LLMClient._parse_response('["a", "b", "c', 3)
+    assert info.value.items == ["a", "b"]